@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""
+DILL ULTIMATE ASCII SUITE - BENCHMARKS
+Reproducible performance suite built on locally generated synthetic clips.
+
+Usage:
+    python benchmark.py                          # run and print results
+    python benchmark.py -o results.json          # store results as JSON
+    python benchmark.py --save-baseline base.json
+    python benchmark.py --baseline base.json --threshold 0.15
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import platform
+import argparse
+import shutil
+import tempfile
+import contextlib
+import subprocess
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+import terminalplayer
+from terminalplayer import (AdvancedAsciiRenderer, CompressedFrameStore, UltimateVideoPlayer,
+                            UltimateVideoConverter, VideoWall, ContactSheet, read_preview_frames,
+                            time_full_render)
+
+# ============================================================================
+# SYNTHETIC FIXTURES
+# ============================================================================
+
+FIXTURE_SIZE = (320, 180)
+# Terminal size the wall stage tiles into, in characters
+WALL_SIZE = (160, 45)
+FIXTURE_FPS = 30.0
+FIXTURE_SEED = 1234
+
+# -X importtime budget for reaching argument dispatch of each CLI mode
+STARTUP_BUDGET_MS = {"play": 75.0, "convert": 75.0}
+# Backends that must stay out of the startup path
+HEAVY_MODULES = ("cv2", "numpy", "rich", "PIL", "pynput", "ffpyplayer")
+# Mean absolute pixel difference allowed between resumed and single-pass frames.
+# Without ffmpeg the join re-encodes (~1.5); a frame from the wrong segment is ~6.
+RESUME_TOLERANCE = 3.0
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "terminalplayer.py")
+
+
+def _gradient_frames(count, width, height, rng):
+    """Diagonal colour gradient scrolling one step per frame"""
+    xs = np.linspace(0, 255, width, dtype=np.float32)[None, :]
+    ys = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    for i in range(count):
+        shift = (i * 4) % 256
+        b = np.broadcast_to((xs + shift) % 256, (height, width))
+        g = np.broadcast_to((ys + shift) % 256, (height, width))
+        r = ((xs + ys) / 2 + shift) % 256
+        yield np.dstack([b, g, r]).astype(np.uint8)
+
+
+def _noise_frames(count, width, height, rng):
+    """Uniform RGB noise - worst case for the diff loop"""
+    for _ in range(count):
+        yield rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+def _slides_frames(count, width, height, rng):
+    """Static slides that change once per second - best case for the diff loop"""
+    slide = None
+    for i in range(count):
+        if i % int(FIXTURE_FPS) == 0:
+            slide = np.zeros((height, width, 3), dtype=np.uint8)
+            slide[:] = rng.integers(0, 96, 3, dtype=np.uint8)
+            for _ in range(6):
+                x1, y1 = int(rng.integers(0, width - 40)), int(rng.integers(0, height - 20))
+                color = tuple(int(c) for c in rng.integers(64, 256, 3))
+                cv2.rectangle(slide, (x1, y1), (x1 + 40, y1 + 20), color, -1)
+            cv2.putText(slide, f"SLIDE {i // int(FIXTURE_FPS) + 1}", (10, height // 2),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+        yield slide
+
+
+def _motion_frames(count, width, height, rng):
+    """Scrolling checkerboard with a bouncing ball - high motion"""
+    yy, xx = np.mgrid[0:height, 0:width]
+    for i in range(count):
+        board = (((xx + i * 6) // 16 + (yy + i * 3) // 16) % 2 * 255).astype(np.uint8)
+        frame = cv2.merge([board, 255 - board, board // 2])
+        cx = int((width / 2) + (width / 3) * np.sin(i / 5))
+        cy = int((height / 2) + (height / 3) * np.cos(i / 7))
+        cv2.circle(frame, (cx, cy), height // 6, (0, 200, 255), -1)
+        yield frame
+
+
+FIXTURES = {
+    "gradient": _gradient_frames,
+    "noise": _noise_frames,
+    "slides": _slides_frames,
+    "motion": _motion_frames,
+}
+
+
+def generate_fixtures(directory, frames, size=FIXTURE_SIZE):
+    """Write every synthetic clip to directory (reusing identical ones)"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    width, height = size
+    paths = {}
+    for name, generator in FIXTURES.items():
+        path = directory / f"{name}_{width}x{height}_{frames}.avi"
+        if not path.exists():
+            rng = np.random.default_rng(FIXTURE_SEED)
+            writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), FIXTURE_FPS, (width, height))
+            if not writer.isOpened():
+                raise RuntimeError(f"Cannot create fixture {path}")
+            for frame in generator(frames, width, height, rng):
+                writer.write(frame)
+            writer.release()
+        paths[name] = str(path)
+    return paths
+
+
+def load_frames(path):
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+# ============================================================================
+# STAGE MEASUREMENTS
+# ============================================================================
+
+
+def _best_of(repeat, func):
+    """Run func repeat times and return (best_seconds, last_result)"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _record(results, key, seconds, frames, **extra):
+    entry = {"seconds": round(seconds, 6), "frames": frames,
+             "fps": round(frames / seconds, 3) if seconds > 0 else 0.0}
+    entry.update(extra)
+    results[key] = entry
+    print(f"  {key:<55} {entry['fps']:>10.1f} frames/s")
+
+
+def bench_decode(results, fixtures, repeat):
+    for name, path in fixtures.items():
+        seconds, frames = _best_of(repeat, lambda: load_frames(path))
+        _record(results, f"decode[{name}]", seconds, len(frames))
+
+
+def bench_render(results, fixtures, widths, charsets, repeat):
+    renderer = AdvancedAsciiRenderer()
+    for name, path in fixtures.items():
+        frames = load_frames(path)
+        for width in widths:
+            for charset in charsets:
+                seconds, _ = _best_of(repeat, lambda: [
+                    renderer.render_frame(f, width, charset, True) for f in frames])
+                _record(results, f"render_frame[{name},w={width},{charset}]", seconds, len(frames))
+
+
+def bench_render_shape(results, fixtures, widths, charsets, repeat):
+    """Shape-aware glyph matching on the array renderer"""
+    renderer = AdvancedAsciiRenderer()
+    for name, path in fixtures.items():
+        frames = load_frames(path)
+        for width in widths:
+            for charset in charsets:
+                seconds, _ = _best_of(repeat, lambda: [
+                    renderer.render_arrays(f, width, charset, True, shape_aware=True) for f in frames])
+                _record(results, f"render_shape[{name},w={width},{charset}]", seconds, len(frames))
+
+
+def bench_diff(results, fixtures, widths, repeat):
+    renderer = AdvancedAsciiRenderer()
+    player = UltimateVideoPlayer()
+    for name, path in fixtures.items():
+        for width in widths:
+            chars = terminalplayer.ASCII_CHAR_SETS["detailed"]
+            rendered = [renderer.render_arrays(f, width, "detailed", True) for f in load_frames(path)]
+            height = rendered[0][0].shape[0]
+
+            def run():
+                prev = player._blank_glyphs(width, height, chars)
+                changed = 0
+                written = 0
+                for glyphs, colors in rendered:
+                    output, count = player._build_frame_update(glyphs, colors, prev, chars)
+                    changed += count
+                    written += len(output.encode('utf-8'))
+                return changed, written
+
+            seconds, (changed, written) = _best_of(repeat, run)
+            cells = width * height * len(rendered)
+            _record(results, f"diff[{name},w={width}]", seconds, len(rendered),
+                    changed_ratio=round(changed / cells, 4),
+                    bytes_per_frame=round(written / len(rendered), 1))
+
+
+def bench_ascii_to_image(results, fixtures, widths, charsets, repeat):
+    renderer = AdvancedAsciiRenderer()
+    converter = UltimateVideoConverter()
+    frames = load_frames(fixtures["motion"])
+    for width in widths:
+        height = width * 9 // 16
+        for charset in charsets:
+            rendered = [renderer.render_frame(f, width, charset, True)[0] for f in frames]
+            seconds, _ = _best_of(repeat, lambda: [
+                converter.ascii_to_image(data, width, height) for data in rendered])
+            _record(results, f"ascii_to_image[w={width},{charset}]", seconds, len(rendered))
+
+
+def bench_playback(results, fixtures, widths, charsets, repeat):
+    """Decode + render + diff + write to a null terminal at maximum speed"""
+    renderer = AdvancedAsciiRenderer()
+    player = UltimateVideoPlayer()
+    for name, path in fixtures.items():
+        for width in widths:
+            for charset in charsets:
+                chars = terminalplayer.ASCII_CHAR_SETS[charset]
+
+                def run():
+                    cap = cv2.VideoCapture(path)
+                    count = 0
+                    prev = None
+                    with open(os.devnull, "w", encoding="utf-8") as null:
+                        while True:
+                            ret, frame = cap.read()
+                            if not ret:
+                                break
+                            glyphs, colors = renderer.render_arrays(frame, width, charset, True)
+                            if prev is None:
+                                prev = player._blank_glyphs(width, glyphs.shape[0], chars)
+                            output, _ = player._build_frame_update(glyphs, colors, prev, chars)
+                            null.write(output)
+                            null.flush()
+                            count += 1
+                    cap.release()
+                    return count
+
+                seconds, count = _best_of(repeat, run)
+                _record(results, f"playback_null[{name},w={width},{charset}]", seconds, count)
+
+
+def bench_wall(results, fixtures, tile_counts, repeat):
+    """Headless wall at maximum speed; bytes per refresh and CPU per stream vs tile count"""
+    sources = list(fixtures.values())
+    for count in tile_counts:
+        tiles = [sources[i % len(sources)] for i in range(count)]
+
+        def run():
+            wall = VideoWall(tiles, {"charset": "detailed", "colorize": True}, size=WALL_SIZE)
+            return wall.run(output=os.devnull, realtime=False)
+
+        seconds, stats = _best_of(repeat, run)
+        cpu_per_frame = [stream["cpu_ms_per_frame"] for stream in stats["streams"]]
+        _record(results, f"wall[tiles={count}]", seconds, stats["refreshes"],
+                bytes_per_refresh=round(stats["bytes_per_refresh"], 1),
+                cpu_ms_per_refresh=round(stats["cpu_ms_per_refresh"], 3),
+                cpu_ms_per_stream_frame=round(sum(cpu_per_frame) / len(cpu_per_frame), 3))
+
+
+def bench_preview(results, fixtures, widths, repeat):
+    """Sparse contact-sheet sampling against rendering every frame of the clip"""
+    path = fixtures["motion"]
+    for width in widths:
+        settings = {"width": width, "charset": "detailed", "colorize": True}
+
+        def run():
+            times, frames, _ = read_preview_frames(path, terminalplayer.PREVIEW_COUNT)
+            sheet = ContactSheet(settings)
+            for frame, timestamp in zip(frames, times):
+                sheet.add(frame, timestamp)
+            return len(sheet.thumbnails)
+
+        seconds, count = _best_of(repeat, run)
+        full_seconds, (total, _) = _best_of(repeat, lambda: time_full_render(path, settings))
+        _record(results, f"preview[w={width}]", seconds, count,
+                full_render_seconds=round(full_seconds, 6), full_render_frames=total,
+                speedup=round(full_seconds / seconds, 2))
+
+
+def bench_frame_store(results, fixtures, widths, repeat):
+    """Compress rendered frames into the store and read them back"""
+    renderer = AdvancedAsciiRenderer()
+    for name, path in fixtures.items():
+        for width in widths:
+            rendered = [renderer.render_arrays(f, width, "detailed", True) for f in load_frames(path)]
+
+            def run():
+                store = CompressedFrameStore()
+                for glyphs, colors in rendered:
+                    store.append(glyphs, colors)
+                for _ in store:
+                    pass
+                return store
+
+            seconds, store = _best_of(repeat, run)
+            _record(results, f"frame_store[{name},w={width}]", seconds, len(rendered),
+                    bytes_per_frame=round(store.bytes_per_frame, 1),
+                    raw_bytes_per_frame=store.raw_bytes_per_frame)
+
+
+def bench_convert(results, fixtures, widths, charsets, repeat, workdir):
+    """Full convert_video run end to end"""
+    converter = UltimateVideoConverter()
+    path = fixtures["motion"]
+    for width in widths:
+        for charset in charsets:
+            output = os.path.join(workdir, f"convert_{width}_{charset}.avi")
+            settings = {"width": width, "height": width * 9 // 16, "charset": charset,
+                        "colorize": True, "output": output}
+
+            def run():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if not converter.convert_video(path, settings):
+                        raise RuntimeError(f"convert_video failed for {settings}")
+                return int(cv2.VideoCapture(output).get(cv2.CAP_PROP_FRAME_COUNT))
+
+            seconds, count = _best_of(repeat, run)
+            _record(results, f"convert[w={width},{charset}]", seconds, count,
+                    output_bytes=os.path.getsize(output))
+
+
+def bench_audio_mux(results, fixtures, widths, repeat, workdir):
+    """convert_video with and without audio passthrough on the motion clip plus a tone"""
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        print("  skipped: ffmpeg not found")
+        return
+    source = os.path.join(workdir, "motion_audio.avi")
+    subprocess.run([ffmpeg, "-y", "-v", "error", "-i", fixtures["motion"],
+                    "-f", "lavfi", "-i", "sine=frequency=440:sample_rate=48000",
+                    "-map", "0:v", "-map", "1:a", "-c:v", "copy", "-c:a", "pcm_s16le", "-shortest", source],
+                   check=True)
+
+    converter = UltimateVideoConverter()
+    for width in widths:
+        timings = {}
+        for audio in (False, True):
+            output = os.path.join(workdir, f"mux_{width}_{audio}.avi")
+            settings = {"width": width, "height": width * 9 // 16, "charset": "detailed",
+                        "colorize": True, "audio": audio, "output": output}
+
+            def run():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if not converter.convert_video(source, settings):
+                        raise RuntimeError(f"convert_video failed for {settings}")
+                return int(cv2.VideoCapture(output).get(cv2.CAP_PROP_FRAME_COUNT))
+
+            seconds, count = _best_of(repeat, run)
+            timings[audio] = seconds
+            extra = {"overhead": round(seconds / timings[False] - 1, 4)} if audio else {}
+            _record(results, f"convert_audio[w={width},{'copy' if audio else 'none'}]", seconds, count,
+                    output_bytes=os.path.getsize(output), **extra)
+
+
+def check_resume(results, fixtures, workdir):
+    """Resume a conversion that a --workers run left with gaps; it must match a single pass.
+
+    Returns True when every frame of the resumed output matches the single-pass output.
+    """
+    converter = UltimateVideoConverter()
+    path = fixtures["motion"]
+    base = {"width": 160, "height": 90, "charset": "detailed", "colorize": True, "audio": False}
+    single = dict(base, output=os.path.join(workdir, "resume_single.avi"), checkpoint_every=0)
+    resumed = dict(base, output=os.path.join(workdir, "resume_gapped.avi"), checkpoint_every=0.5)
+
+    cap = cv2.VideoCapture(path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or FIXTURE_FPS
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    # Leave every other segment done, as an interrupted parallel run would
+    with contextlib.redirect_stdout(io.StringIO()):
+        job = terminalplayer.SegmentedJob.load_or_plan(resumed["output"] + ".parts", path, resumed,
+                                                       total_frames, fps, int(fps * 0.5),
+                                                       align_keyframes=False)
+        for segment in job.segments[::2]:
+            job.mark_done(terminalplayer._convert_segment(path, resumed, fps, segment, job.workdir))
+        if not converter.convert_video(path, single) or not converter.convert_video(path, resumed):
+            raise RuntimeError("convert_video failed for the resume check")
+
+    expected, actual = load_frames(single["output"]), load_frames(resumed["output"])
+    mismatched = sum(1 for a, b in zip(expected, actual)
+                     if np.abs(a.astype(np.int16) - b.astype(np.int16)).mean() > RESUME_TOLERANCE)
+    mismatched += abs(len(expected) - len(actual))
+    ok = mismatched == 0
+    results["resume[gapped]"] = {"frames": len(actual), "segments": len(job.segments),
+                                 "mismatched_frames": mismatched, "matches_single_pass": ok}
+    marker = "✅" if ok else "❌"
+    print(f"  {'resume[gapped]':<55} {mismatched:>4} of {len(expected)} frames differ {marker}")
+    return ok
+
+
+def measure_startup(command):
+    """Run `terminalplayer.py <command> --help` under -X importtime.
+
+    Returns (wall_seconds, import_ms, heavy_modules_imported).
+    """
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", SCRIPT, command, "--help"],
+                          capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+
+    import_us = 0
+    heavy = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        module = name.strip()
+        # Top-level entries carry a single space of indentation
+        if name[1:2] != " ":
+            import_us += int(cumulative)
+        if module.split(".")[0] in HEAVY_MODULES:
+            heavy.add(module.split(".")[0])
+    return wall, import_us / 1000, sorted(heavy)
+
+
+def bench_startup(results, repeat):
+    failures = []
+    for command, budget in STARTUP_BUDGET_MS.items():
+        runs = [measure_startup(command) for _ in range(repeat)]
+        wall, import_ms, heavy = min(runs, key=lambda run: run[1])
+        within = import_ms <= budget and not heavy
+        results[f"startup[{command}]"] = {
+            "seconds": round(wall, 6),
+            "import_ms": round(import_ms, 3),
+            "budget_ms": budget,
+            "heavy_imports": heavy,
+            "within_budget": within,
+        }
+        marker = "✅" if within else "❌"
+        print(f"  {'startup[' + command + ']':<55} {import_ms:>8.1f} ms import "
+              f"(budget {budget:.0f} ms) {marker}")
+        if heavy:
+            print(f"    eagerly imported: {', '.join(heavy)}")
+        if not within:
+            failures.append(command)
+    return failures
+
+
+def bench_exporters(results, fixtures, widths, charsets, repeat, workdir):
+    """Stream the motion clip through every exporter; report time and output size"""
+    converter = UltimateVideoConverter()
+    path = fixtures["motion"]
+    extensions = {"html": ".html", "text": ".txt", "ansi": ".ans", "gif": ".gif", "apng": ".png"}
+    for fmt, extension in extensions.items():
+        for width in widths:
+            for charset in charsets:
+                output = os.path.join(workdir, f"export_{width}_{charset}{extension}")
+                settings = {"columns": width, "charset": charset, "colorize": True, "output": output}
+
+                def run():
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        stats = converter.export_video(path, settings, fmt)
+                    if not stats:
+                        raise RuntimeError(f"export_video failed for {fmt}")
+                    return stats
+
+                seconds, stats = _best_of(repeat, run)
+                _record(results, f"export[{fmt},w={width},{charset}]", seconds, stats["frames"],
+                        output_bytes=stats["bytes"],
+                        ms_per_frame=round(1000 * seconds / max(1, stats["frames"]), 3))
+
+# ============================================================================
+# RESULTS AND BASELINE COMPARISON
+# ============================================================================
+
+
+def collect_metadata(args):
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "opencv": cv2.__version__,
+        "numpy": np.__version__,
+        "pillow": terminalplayer.PILLOW_AVAILABLE,
+        "frames": args.frames,
+        "repeat": args.repeat,
+        "widths": args.widths,
+        "charsets": args.charsets,
+    }
+
+
+def _throughput(entry):
+    """Higher-is-better score: frames/s, or inverse import time for startup"""
+    if "fps" in entry:
+        return entry["fps"]
+    if entry.get("import_ms"):
+        return 1000.0 / entry["import_ms"]
+    return 0.0
+
+
+def compare_with_baseline(results, baseline, threshold):
+    """Return a list of (key, baseline_score, current_score, change) regressions.
+
+    Scores are _throughput values, so startup entries compare inverse import time.
+    """
+    regressions = []
+    print(f"\n📊 Comparison with baseline (threshold {threshold:.0%}):")
+    for key, entry in results.items():
+        base = baseline.get(key)
+        if not base or not _throughput(base):
+            print(f"  {key:<55} {'new':>10}")
+            continue
+        change = _throughput(entry) / _throughput(base) - 1.0
+        marker = "❌" if change < -threshold else "✅"
+        print(f"  {key:<55} {change:>+9.1%} {marker}")
+        if change < -threshold:
+            regressions.append((key, _throughput(base), _throughput(entry), change))
+    return regressions
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the ASCII suite on synthetic clips")
+    parser.add_argument("-o", "--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a saved results JSON")
+    parser.add_argument("--save-baseline", help="Write results JSON as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed slowdown before a stage counts as a regression (default 0.10)")
+    parser.add_argument("--frames", type=int, default=60, help="Frames per synthetic clip")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    parser.add_argument("--widths", type=int, nargs="+", default=[80, 120],
+                        help="ASCII widths for render/playback stages")
+    parser.add_argument("--convert-widths", type=int, nargs="+", default=[160],
+                        help="Output pixel widths for conversion stages")
+    parser.add_argument("--wall-tiles", type=int, nargs="+", default=[1, 4, 9],
+                        help="Tile counts for the video wall stage")
+    parser.add_argument("--charsets", nargs="+", default=["simple", "detailed"],
+                        choices=list(terminalplayer.ASCII_CHAR_SETS.keys()))
+    parser.add_argument("--fixtures", default=os.path.join(tempfile.gettempdir(), "ascii_suite_fixtures"),
+                        help="Directory for generated clips")
+    parser.add_argument("--stages", nargs="+",
+                        default=["startup", "decode", "render", "render_shape", "diff", "frame_store",
+                                 "ascii_to_image", "playback", "wall", "preview", "export", "convert",
+                                 "audio_mux", "resume"],
+                        help="Subset of stages to run")
+    return parser
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+
+    print(f"🎬 Generating fixtures in {args.fixtures} ...")
+    fixtures = generate_fixtures(args.fixtures, args.frames)
+
+    results = {}
+    startup_failures = []
+    resume_ok = True
+    with tempfile.TemporaryDirectory() as workdir:
+        if "startup" in args.stages:
+            print("\n⏱️  startup")
+            startup_failures = bench_startup(results, args.repeat)
+        if "decode" in args.stages:
+            print("\n⏱️  decode")
+            bench_decode(results, fixtures, args.repeat)
+        if "render" in args.stages:
+            print("\n⏱️  render_frame")
+            bench_render(results, fixtures, args.widths, args.charsets, args.repeat)
+        if "render_shape" in args.stages:
+            print("\n⏱️  shape-aware render")
+            bench_render_shape(results, fixtures, args.widths, args.charsets, args.repeat)
+        if "diff" in args.stages:
+            print("\n⏱️  diff")
+            bench_diff(results, fixtures, args.widths, args.repeat)
+        if "frame_store" in args.stages:
+            print("\n⏱️  frame store")
+            bench_frame_store(results, fixtures, args.widths, args.repeat)
+        if "ascii_to_image" in args.stages:
+            print("\n⏱️  ascii_to_image")
+            bench_ascii_to_image(results, fixtures, args.convert_widths, args.charsets, args.repeat)
+        if "playback" in args.stages:
+            print("\n⏱️  playback to null terminal")
+            bench_playback(results, fixtures, args.widths, args.charsets, args.repeat)
+        if "wall" in args.stages:
+            print("\n⏱️  video wall")
+            bench_wall(results, fixtures, args.wall_tiles, args.repeat)
+        if "preview" in args.stages:
+            print("\n⏱️  preview contact sheet")
+            bench_preview(results, fixtures, args.widths, args.repeat)
+        if "export" in args.stages:
+            print("\n⏱️  exporters")
+            bench_exporters(results, fixtures, args.widths, args.charsets, args.repeat, workdir)
+        if "convert" in args.stages:
+            print("\n⏱️  convert_video")
+            bench_convert(results, fixtures, args.convert_widths, args.charsets, args.repeat, workdir)
+        if "audio_mux" in args.stages:
+            print("\n⏱️  audio passthrough")
+            bench_audio_mux(results, fixtures, args.convert_widths, args.repeat, workdir)
+        if "resume" in args.stages:
+            print("\n🔁 resume after a partial parallel run")
+            resume_ok = check_resume(results, fixtures, workdir)
+
+    report = {"meta": collect_metadata(args), "results": results}
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+            print(f"\n💾 Results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            return 1
+        print("\n✅ No regressions")
+
+    if startup_failures:
+        print(f"\n❌ Startup budget exceeded for: {', '.join(startup_failures)}")
+        return 1
+    if not resume_ok:
+        print("\n❌ Resumed conversion differs from a single pass")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
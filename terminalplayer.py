@@ -7,91 +7,149 @@ Complete 1000+ Lines - Fully Working - No Rainbow Errors
 import os
 import sys
 import time
-import cv2
+import json
+import math
+import zlib
+import html
+import struct
 import argparse
+import importlib
+import functools
+import contextlib
 import threading
 import tempfile
 import shutil
+import signal
 import subprocess
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict, Any
 from concurrent.futures import ThreadPoolExecutor
 
 # ============================================================================
-# BULLETPROOF IMPORTS - NO ERRORS
-# ============================================================================
-
-# Rich UI - Safe import
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
-    from rich import box
-    from rich.text import Text
-    from rich.align import Align
-    from rich.columns import Columns
-    from rich.prompt import Prompt, Confirm
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    print("✨ Install rich for better UI: pip install rich")
-
-# Image processing
-try:
-    from PIL import Image, ImageDraw, ImageFont
-    PILLOW_AVAILABLE = True
-except ImportError:
-    PILLOW_AVAILABLE = False
-    print("🖼️  Install pillow for better quality: pip install pillow")
-
-# Keyboard controls
-try:
-    from pynput import keyboard
-    KEYBOARD_AVAILABLE = True
-except ImportError:
-    KEYBOARD_AVAILABLE = False
-    print("⌨️  Install pynput for keyboard controls: pip install pynput")
-
-# Audio playback
-try:
-    from ffpyplayer.player import MediaPlayer
-    AUDIO_AVAILABLE = True
-except ImportError:
-    AUDIO_AVAILABLE = False
-    print("🔊 Install ffpyplayer for audio: pip install ffpyplayer")
-
-# Initialize console
-if RICH_AVAILABLE:
-    console = Console()
-else:
-    class BasicConsole:
-        def __init__(self): 
-            self.spinner_chars = "|/-\\"
-            self.spinner_index = 0
-            
-        def print(self, msg): 
-            print(msg)
-            
-        def input(self, prompt): 
-            return input(prompt)
-            
-        def clear(self): 
-            os.system('cls' if os.name == 'nt' else 'clear')
-            
-        def status(self, msg):
-            class Status:
-                def __init__(self, console, msg):
-                    self.console = console
-                    self.msg = msg
-                def __enter__(self):
-                    return self
-                def __exit__(self, *args):
-                    pass
-                def update(self, msg):
-                    print(f"\r{msg}", end="", flush=True)
-            return Status(self, msg)
-    console = BasicConsole()
+# LAZY IMPORTS - BACKENDS LOAD ONLY WHEN A MODE NEEDS THEM
+# ============================================================================
+
+INSTALL_HINTS = {
+    "opencv": "❌ OpenCV is required. Install with: pip install opencv-python",
+    "rich": "✨ Install rich for better UI: pip install rich",
+    "pillow": "🖼️  Install pillow for better quality: pip install pillow",
+    "keyboard": "⌨️  Install pynput for keyboard controls: pip install pynput",
+    "audio": "🔊 Install ffpyplayer for audio: pip install ffpyplayer",
+}
+
+@functools.lru_cache(maxsize=None)
+def _optional_import(name):
+    """Import an optional backend once; None if it is missing or fails to load.
+
+    pynput raises more than ImportError on headless Linux, so any failure
+    counts as unavailable.
+    """
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
+
+def rich_available():
+    return _optional_import("rich.console") is not None
+
+def pillow_available():
+    return _optional_import("PIL.Image") is not None
+
+def keyboard_available():
+    return _optional_import("pynput.keyboard") is not None
+
+def audio_available():
+    return _optional_import("ffpyplayer.player") is not None
+
+_CAPABILITY_PROBES = {
+    "RICH_AVAILABLE": rich_available,
+    "PILLOW_AVAILABLE": pillow_available,
+    "KEYBOARD_AVAILABLE": keyboard_available,
+    "AUDIO_AVAILABLE": audio_available,
+}
+
+def __getattr__(name):
+    # Keep the old module-level flags working for external callers
+    if name in _CAPABILITY_PROBES:
+        return _CAPABILITY_PROBES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class _LazyModule:
+    """Stand-in that imports the real module on first attribute access"""
+    def __init__(self, name, fallback=None):
+        self._name = name
+        self._fallback = fallback
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError:
+                if self._fallback is None:
+                    raise
+                self._module = self._fallback()
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+class SimpleNP:
+    """Basic numpy replacement"""
+    @staticmethod
+    def array(data, dtype=None):
+        return data
+    @staticmethod
+    def zeros(shape, dtype=None):
+        if len(shape) == 2:
+            return [[0] * shape[1] for _ in range(shape[0])]
+        elif len(shape) == 3:
+            return [[[0] * shape[2] for _ in range(shape[1])] for _ in range(shape[0])]
+        return [[0] * shape[1] for _ in range(shape[0])]
+
+cv2 = _LazyModule("cv2")
+np = _LazyModule("numpy", fallback=SimpleNP)
+
+class BasicConsole:
+    def __init__(self): 
+        self.spinner_chars = "|/-\\"
+        self.spinner_index = 0
+        
+    def print(self, msg): 
+        print(msg)
+        
+    def input(self, prompt): 
+        return input(prompt)
+        
+    def clear(self): 
+        os.system('cls' if os.name == 'nt' else 'clear')
+        
+    def status(self, msg):
+        class Status:
+            def __init__(self, console, msg):
+                self.console = console
+                self.msg = msg
+            def __enter__(self):
+                return self
+            def __exit__(self, *args):
+                pass
+            def update(self, msg):
+                print(f"\r{msg}", end="", flush=True)
+        return Status(self, msg)
+
+@functools.lru_cache(maxsize=None)
+def _console_backend():
+    if rich_available():
+        from rich.console import Console
+        return Console()
+    return BasicConsole()
+
+class _LazyConsole:
+    """Creates the Rich or basic console the first time something is printed"""
+    def __getattr__(self, name):
+        return getattr(_console_backend(), name)
+
+console = _LazyConsole()
 
 # ============================================================================
 # CORE CONFIGURATION - NO RAINBOW
@@ -106,6 +164,11 @@ ASCII_CHAR_SETS = {
     "art": " ♥♦♣♠•◘○◙♂♀♪♫☼►◄↕‼¶§▬↨↑↓→←∟↔▲▼",
 }
 
+# Terminal control sequences shared by interactive and headless playback
+CLEAR_SCREEN = "\033[H\033[2J"
+HIDE_CURSOR = "\033[?25l"
+RESET_TERMINAL = "\033[?25h\033[0m\033[H\033[J"
+
 class PlayerState:
     def __init__(self):
         self.is_paused = False
@@ -131,7 +194,8 @@ class KeyboardHandler:
         self.listener = None
 
     def start(self):
-        if not KEYBOARD_AVAILABLE:
+        keyboard = _optional_import("pynput.keyboard")
+        if keyboard is None:
             return
             
         def on_press(key):
@@ -188,7 +252,11 @@ class UltimateInterface:
         
     @staticmethod
     def show_playback_info(video_path, width, height, fps, charset, audio):
-        if RICH_AVAILABLE:
+        if rich_available():
+            from rich import box
+            from rich.panel import Panel
+            from rich.table import Table
+
             info_table = Table.grid()
             info_table.add_column(style="cyan", justify="right")
             info_table.add_column(style="white")
@@ -223,11 +291,96 @@ class UltimateInterface:
 # ADVANCED ASCII RENDERER - FULLY WORKING
 # ============================================================================
 
+# Sub-cell grid (columns, rows) used to describe glyph shapes
+GLYPH_GRID = (2, 4)
+# Shade characters drawn as uniform coverage instead of rasterized text
+SHADE_COVERAGE = {' ': 0.0, '░': 0.25, '▒': 0.5, '▓': 0.75, '█': 1.0}
+# How strongly shape agreement may outweigh brightness error
+SHAPE_WEIGHT = 0.1
+
+@functools.lru_cache(maxsize=None)
+def glyph_atlas(charset, cell_width=16, cell_height=32):
+    """Rasterize every glyph of a charset once: (glyphs, cell_height, cell_width) coverage in [0, 1]"""
+    chars = ASCII_CHAR_SETS.get(charset, charset)
+    ImageDraw = _optional_import("PIL.ImageDraw")
+    ImageFont = _optional_import("PIL.ImageFont")
+    Image = _optional_import("PIL.Image")
+    atlas = np.zeros((len(chars), cell_height, cell_width), dtype=np.float32)
+
+    for index, char in enumerate(chars):
+        if char in SHADE_COVERAGE:
+            atlas[index] = SHADE_COVERAGE[char]
+            continue
+
+        canvas = np.zeros((cell_height, cell_width), dtype=np.uint8)
+        if char.isascii():
+            scale = cell_height / 32 * 0.9
+            (text_width, _), _ = cv2.getTextSize(char, cv2.FONT_HERSHEY_SIMPLEX, scale, 1)
+            origin = (max(0, (cell_width - text_width) // 2), int(cell_height * 0.8))
+            cv2.putText(canvas, char, origin, cv2.FONT_HERSHEY_SIMPLEX, scale, 255, 1, cv2.LINE_AA)
+        elif Image is not None:
+            image = Image.new("L", (cell_width, cell_height), 0)
+            font = ImageFont.load_default()
+            ImageDraw.Draw(image).text((cell_width // 2, cell_height // 2), char, fill=255, font=font, anchor="mm")
+            canvas = np.asarray(image)
+
+        if canvas.any():
+            atlas[index] = canvas / 255.0
+        else:
+            # No way to draw this glyph: fall back to its position on the brightness ramp
+            atlas[index] = index / max(1, len(chars) - 1)
+    return atlas
+
+@functools.lru_cache(maxsize=None)
+def glyph_features(charset):
+    """Feature index for a charset: (levels, patterns).
+
+    levels is each glyph's place on the charset's brightness ramp. patterns
+    holds each glyph's sub-cell coverage with its mean removed, scaled to unit
+    length (zero for flat glyphs such as space or full block).
+    """
+    atlas = glyph_atlas(charset)
+    columns, rows = GLYPH_GRID
+    coverage = np.stack([
+        cv2.resize(glyph, (columns, rows), interpolation=cv2.INTER_AREA).ravel() for glyph in atlas
+    ]).astype(np.float32)
+
+    levels = np.linspace(0.0, 1.0, len(atlas), dtype=np.float32)
+    patterns = coverage - coverage.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(patterns, axis=1, keepdims=True)
+    patterns = np.divide(patterns, norms, out=np.zeros_like(patterns), where=norms > 1e-6)
+
+    # Ramps that run from dense to sparse glyphs (e.g. "extended") draw dark as ink
+    density = coverage.mean(axis=1)
+    if len(atlas) > 2 and np.corrcoef(density, levels)[0, 1] < 0:
+        patterns = -patterns
+    return levels, patterns
+
 class AdvancedAsciiRenderer:
     def __init__(self):
         self.cache = {}
         
-    def render_frame(self, frame, width: int, charset: str = "detailed", colorize: bool = True) -> Tuple[List, int]:
+    def render_frame(self, frame, width: int, charset: str = "detailed", colorize: bool = True,
+                     shape_aware: bool = False) -> Tuple[List, int]:
+        glyphs, colors = self.render_arrays(frame, width, charset, colorize, shape_aware)
+        if glyphs is None:
+            return [], 0
+
+        ascii_chars = ASCII_CHAR_SETS.get(charset, ASCII_CHAR_SETS["detailed"])
+        frame_data = [
+            [(ascii_chars[index], tuple(color)) for index, color in zip(glyph_row, color_row)]
+            for glyph_row, color_row in zip(glyphs.tolist(), colors.tolist())
+        ]
+        return frame_data, len(frame_data)
+
+    def render_arrays(self, frame, width: int, charset: str = "detailed", colorize: bool = True,
+                      shape_aware: bool = False):
+        """Render a frame as a (height, width) glyph index plane and a (height, width, 3) RGB plane.
+
+        Glyph indices point into the charset string. With shape_aware each cell
+        picks the glyph whose shape best matches its sub-cell luminance pattern
+        instead of using mean brightness alone. Returns (None, None) on failure.
+        """
         try:
             # Convert to RGB
             if len(frame.shape) == 3:
@@ -241,47 +394,438 @@ class AdvancedAsciiRenderer:
             height = int(width * aspect_ratio * 0.5)
             
             if height <= 0:
-                return [], 0
+                return None, None
                 
             # High-quality resize with PIL if available
-            if PILLOW_AVAILABLE:
+            Image = _optional_import("PIL.Image")
+            if Image is not None:
                 pil_img = Image.fromarray(frame_rgb)
-                resized = pil_img.resize((width, height), Image.Resampling.LANCZOS)
-                pixels = resized.load()
+                resized = np.asarray(pil_img.resize((width, height), Image.Resampling.LANCZOS))
             else:
                 resized = cv2.resize(frame_rgb, (width, height))
-                pixels = resized
             
             # Get character set
             ascii_chars = ASCII_CHAR_SETS.get(charset, ASCII_CHAR_SETS["detailed"])
             num_chars = len(ascii_chars)
-            
-            frame_data = []
-            for y in range(height):
-                row = []
-                for x in range(width):
-                    if PILLOW_AVAILABLE:
-                        r, g, b = pixels[x, y]
-                    else:
-                        r, g, b = pixels[y, x]
-                    
-                    brightness = int(0.299 * r + 0.587 * g + 0.114 * b)
-                    char_index = min(int((brightness / 255) * (num_chars - 1)), num_chars - 1)
-                    char = ascii_chars[char_index]
-                    
-                    if colorize:
-                        row.append((char, (r, g, b)))
-                    else:
-                        gray = brightness
-                        row.append((char, (gray, gray, gray)))
-                        
-                frame_data.append(row)
-                
-            return frame_data, height
+
+            brightness = self.luminance(resized)
+            if shape_aware:
+                glyphs = self._match_glyph_shapes(frame_rgb, width, height, charset)
+            else:
+                glyphs = self.ramp_glyphs(brightness, num_chars)
+
+            if colorize:
+                colors = np.ascontiguousarray(resized, dtype=np.uint8)
+            else:
+                colors = np.repeat(brightness[..., None], 3, axis=2)
+            return glyphs, colors
             
         except Exception as e:
             console.print(f"⚠️  Rendering error: {e}")
-            return [], 0
+            return None, None
+
+    @staticmethod
+    def luminance(rgb):
+        rgb = rgb.astype(np.float64)
+        return (0.299 * rgb[..., 0] + 0.587 * rgb[..., 1] + 0.114 * rgb[..., 2]).astype(np.uint8)
+
+    @staticmethod
+    def ramp_glyphs(brightness, num_chars):
+        """Glyph indices from brightness, darkest glyph first"""
+        return np.minimum((brightness / 255 * (num_chars - 1)).astype(np.uint8), num_chars - 1)
+
+    def _match_glyph_shapes(self, frame_rgb, width, height, charset):
+        """Best glyph for every cell by sub-cell luminance, scored against all glyphs at once.
+
+        Each glyph scores (cell mean - glyph level)^2 minus SHAPE_WEIGHT times the
+        correlation between the cell's luminance pattern and the glyph's shape.
+        Flat cells therefore fall back to the plain brightness ramp.
+        """
+        columns, rows = GLYPH_GRID
+        levels, patterns = glyph_features(charset)
+
+        gray = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2GRAY)
+        sub = cv2.resize(gray, (width * columns, height * rows), interpolation=cv2.INTER_AREA)
+        cells = (sub.reshape(height, rows, width, columns)
+                    .transpose(0, 2, 1, 3)
+                    .reshape(height * width, rows * columns)
+                    .astype(np.float32) / 255.0)
+        means = cells.mean(axis=1, keepdims=True)
+
+        # (m - l)^2 = m^2 - 2ml + l^2; m^2 is the same for every glyph
+        scores = levels[None, :] ** 2 - 2.0 * means * levels[None, :]
+        scores -= SHAPE_WEIGHT * ((cells - means) @ patterns.T)
+        return scores.argmin(axis=1).astype(np.uint8).reshape(height, width)
+
+# ============================================================================
+# COMPRESSED FRAME STORE
+# ============================================================================
+
+DEFAULT_MEMORY_BUDGET = "512M"
+
+def parse_memory_size(value):
+    """Parse sizes such as '512M', '2G', '750k' or plain bytes"""
+    units = {'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+    text = str(value).strip().lower().rstrip('b')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(float(text))
+
+def format_memory_size(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GB"
+
+class CompressedFrameStore:
+    """Pre-rendered frames kept as zlib-compressed glyph and colour planes.
+
+    Each frame is stored independently, so any frame can be decompressed on
+    its own. Iteration decompresses a few frames ahead on a background thread
+    (zlib releases the GIL).
+    """
+    def __init__(self, memory_budget=None, level=1, readahead=4):
+        self.memory_budget = memory_budget
+        self.level = level
+        self.readahead = readahead
+        self.frames = []
+        self.total_bytes = 0
+        self.shape = None
+
+    def append(self, glyphs, colors):
+        """Compress and keep a frame; False if it would exceed the memory budget"""
+        if self.shape is None:
+            self.shape = glyphs.shape
+        payload = zlib.compress(glyphs.tobytes() + colors.tobytes(), self.level)
+        if self.memory_budget and self.total_bytes + len(payload) > self.memory_budget:
+            return False
+        self.frames.append(payload)
+        self.total_bytes += len(payload)
+        return True
+
+    def _decode(self, payload):
+        height, width = self.shape
+        data = zlib.decompress(payload)
+        cells = height * width
+        glyphs = np.frombuffer(data, dtype=np.uint8, count=cells).reshape(height, width)
+        colors = np.frombuffer(data, dtype=np.uint8, offset=cells).reshape(height, width, 3)
+        return glyphs, colors
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        return self._decode(self.frames[index])
+
+    def __iter__(self):
+        if not self.frames:
+            return
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = [pool.submit(self._decode, payload) for payload in self.frames[:self.readahead]]
+            for index in range(len(self.frames)):
+                ahead = index + self.readahead
+                if ahead < len(self.frames):
+                    pending.append(pool.submit(self._decode, self.frames[ahead]))
+                yield pending.pop(0).result()
+
+    @property
+    def bytes_per_frame(self):
+        return self.total_bytes / len(self.frames) if self.frames else 0.0
+
+    @property
+    def raw_bytes_per_frame(self):
+        return self.shape[0] * self.shape[1] * 4 if self.shape else 0
+
+# ============================================================================
+# HEADLESS STREAM WRITERS
+# ============================================================================
+
+class RawStreamWriter:
+    """Writes the terminal escape stream unchanged"""
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data, timestamp):
+        self.stream.write(data)
+
+class AsciicastWriter:
+    """Writes the terminal escape stream as an asciinema v2 .cast recording"""
+    def __init__(self, stream, width, height):
+        self.stream = stream
+        header = {
+            "version": 2,
+            "width": width,
+            "height": height,
+            "timestamp": int(time.time()),
+            "env": {"TERM": "xterm-256color"},
+        }
+        self.stream.write(json.dumps(header) + "\n")
+
+    def write(self, data, timestamp):
+        self.stream.write(json.dumps([round(timestamp, 6), "o", data], ensure_ascii=False) + "\n")
+
+class EscapeStream:
+    """Where a playback escape stream goes: the terminal (output=None), a file, a pipe or '-'.
+
+    Wraps the stream in a raw or .cast writer and counts the bytes written.
+    With flush=True every write is flushed so a viewer sees each frame as it
+    is produced; otherwise the stream is flushed once on close.
+    """
+    def __init__(self, output=None, cast=False, width=0, height=0, flush=True):
+        if output is None or output == '-':
+            self.stream = sys.stdout
+        else:
+            self.stream = open(output, 'w', encoding='utf-8', newline='')
+        if cast and output is not None:
+            self.writer = AsciicastWriter(self.stream, width, height)
+        else:
+            self.writer = RawStreamWriter(self.stream)
+        self.flush = flush
+        self.bytes = 0
+
+    def write(self, data, timestamp):
+        self.writer.write(data, timestamp)
+        if self.flush:
+            self.stream.flush()
+        self.bytes += len(data.encode('utf-8'))
+
+    def close(self):
+        self.stream.flush()
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+# ============================================================================
+# LIVE INPUT - CAPTURE DEVICES AND NETWORK STREAMS
+# ============================================================================
+
+# Ask FFmpeg not to buffer network input; users can override through the environment
+LIVE_FFMPEG_OPTIONS = "fflags;nobuffer|flags;low_delay|probesize;32|analyzeduration;0"
+
+def open_live_source(source):
+    """Open a device index, device path, stream URL or '-' (stdin) for low-latency reading"""
+    if source.isdigit():
+        cap = cv2.VideoCapture(int(source))
+    elif source.startswith("/dev/"):
+        cap = cv2.VideoCapture(source)
+    else:
+        os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", LIVE_FFMPEG_OPTIONS)
+        cap = cv2.VideoCapture("pipe:0" if source == '-' else source, cv2.CAP_FFMPEG)
+    # Keep at most one decoded frame queued inside the backend
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
+# Largest believable gap between a V4L2 buffer timestamp and read() returning it
+MAX_CAPTURE_DELAY = 5.0
+
+class LatestFrameGrabber:
+    """Reads a capture on a background thread and keeps only the newest frame.
+
+    Frames that are replaced before the renderer picks them up are counted as
+    dropped. Regular files are paced at their frame rate so they can stand in
+    for a live feed. The grabber owns the capture and releases it from its own
+    thread, since a stalled stream can block read() long after stop().
+
+    Each frame is stamped with its capture time when the backend provides one
+    on the monotonic clock (V4L2 buffer timestamps). Otherwise the stamp is
+    taken when read() returns, after any backend, network and decoder
+    buffering; latency_origin says which.
+    """
+    def __init__(self, cap, pace_fps=None):
+        self.cap = cap
+        self.pace_fps = pace_fps
+        self.frame = None
+        self.grab_time = 0.0
+        self.sequence = 0
+        self.captured = 0
+        self.dropped = 0
+        self.finished = False
+        self._consumed = 0
+        try:
+            self._buffer_timestamps = cap.getBackendName() == "V4L2"
+        except Exception:
+            self._buffer_timestamps = False
+        self.latency_origin = "capture" if self._buffer_timestamps else "decode"
+        self._running = True
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        next_time = time.monotonic()
+        try:
+            while self._running:
+                ret, frame = self.cap.read()
+                grabbed = time.monotonic()
+                if not ret:
+                    break
+                if self._buffer_timestamps:
+                    stamp = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+                    if 0.0 <= grabbed - stamp < MAX_CAPTURE_DELAY:
+                        grabbed = stamp
+                    else:
+                        # Driver stamps on another clock; fall back for the whole session
+                        self._buffer_timestamps = False
+                        self.latency_origin = "decode"
+                with self._condition:
+                    if self.sequence > self._consumed:
+                        self.dropped += 1
+                    self.frame = frame
+                    self.grab_time = grabbed
+                    self.sequence += 1
+                    self.captured += 1
+                    self._condition.notify()
+                if self.pace_fps:
+                    next_time += 1.0 / self.pace_fps
+                    time.sleep(max(0.0, next_time - time.monotonic()))
+        finally:
+            # Released here, never while read() may still be running on another thread
+            self.cap.release()
+            with self._condition:
+                self.finished = True
+                self._condition.notify()
+
+    def newest(self, timeout=1.0):
+        """Wait for a frame newer than the last one returned: (frame, grab_time) or (None, None)"""
+        with self._condition:
+            self._condition.wait_for(lambda: self.sequence > self._consumed or self.finished, timeout)
+            if self.sequence <= self._consumed:
+                return None, None
+            self._consumed = self.sequence
+            return self.frame, self.grab_time
+
+    def stop(self):
+        """Ask the thread to finish; a read blocked on a stalled stream is left to time out"""
+        self._running = False
+        self._thread.join(timeout=2.0)
+
+# ============================================================================
+# TERMINAL RESIZE - SIGWINCH AND RENDER PYRAMID
+# ============================================================================
+
+# Widths playback snaps to after a resize, so dragging a window edge does not
+# switch resolution on every column
+PYRAMID_WIDTHS = (40, 60, 80, 100, 120, 160, 200, 240, 320)
+# How often terminal size is polled where SIGWINCH does not exist (Windows)
+RESIZE_POLL_SECONDS = 0.5
+
+def playback_width(columns, settings):
+    """Width the player wants for a terminal with this many columns"""
+    if settings['auto_width']:
+        preferred = max(60, int(columns * 0.85))
+    else:
+        preferred = settings['width']
+    # A frame as wide as the terminal wraps and scrolls
+    return max(1, min(preferred, columns - 1))
+
+class TerminalResizeWatcher:
+    """Reports terminal size changes, from SIGWINCH where available or by polling"""
+    def __init__(self):
+        self.size = shutil.get_terminal_size()
+        self._pending = False
+        self._installed = False
+        self._previous_handler = None
+        self._last_poll = time.monotonic()
+
+    def start(self):
+        sigwinch = getattr(signal, 'SIGWINCH', None)
+        # Signal handlers can only be installed from the main thread
+        if sigwinch is not None and threading.current_thread() is threading.main_thread():
+            self._previous_handler = signal.signal(sigwinch, self._on_resize)
+            self._installed = True
+        return self
+
+    def _on_resize(self, signum, frame):
+        self._pending = True
+
+    def poll(self):
+        """New terminal size if it changed since the last call, otherwise None"""
+        if self._installed:
+            if not self._pending:
+                return None
+            self._pending = False
+        else:
+            now = time.monotonic()
+            if now - self._last_poll < RESIZE_POLL_SECONDS:
+                return None
+            self._last_poll = now
+
+        size = shutil.get_terminal_size()
+        if size == self.size:
+            return None
+        self.size = size
+        return size
+
+    def stop(self):
+        if self._installed:
+            signal.signal(signal.SIGWINCH, self._previous_handler or signal.SIG_DFL)
+            self._installed = False
+
+class RenderPyramid:
+    """Frames of a pre-rendered store at other widths, so playback can follow the terminal.
+
+    Narrower levels are area-downscaled from the stored colour plane and
+    re-quantized to glyphs, which costs less than decompressing the frame.
+    Wider levels are rendered on the fly from a decoder kept in step with
+    playback. Shape-aware glyphs need the source pixels, so with shape_aware
+    every level is rendered from the decoder.
+    """
+    def __init__(self, video_path, base_width, renderer, settings):
+        self.video_path = video_path
+        self.base_width = base_width
+        self.renderer = renderer
+        self.settings = settings
+        self.chars = ASCII_CHAR_SETS.get(settings['charset'], ASCII_CHAR_SETS["detailed"])
+        self.cap = None
+        self.position = None
+        self.rerendered = 0
+        self.resampled = 0
+
+    def level_for(self, columns):
+        """Largest level (stored width included) that fits the terminal"""
+        target = playback_width(columns, self.settings)
+        levels = [w for w in PYRAMID_WIDTHS + (self.base_width,) if w <= target]
+        return max(levels) if levels else target
+
+    def frame(self, index, glyphs, colors, width):
+        """Frame `index` at `width`, given its stored glyph and colour planes"""
+        if width == self.base_width:
+            return glyphs, colors
+        if width > self.base_width or self.settings.get('shape_aware', False):
+            rendered = self._rerender(index, width)
+            if rendered[0] is not None:
+                return rendered
+        return self._resample(colors, width)
+
+    def _resample(self, colors, width):
+        base_height = colors.shape[0]
+        height = max(1, round(base_height * width / self.base_width))
+        small = cv2.resize(colors, (width, height), interpolation=cv2.INTER_AREA)
+        glyphs = self.renderer.ramp_glyphs(self.renderer.luminance(small), len(self.chars))
+        self.resampled += 1
+        return glyphs, small
+
+    def _rerender(self, index, width):
+        if self.cap is None:
+            self.cap = cv2.VideoCapture(self.video_path)
+        if self.position != index:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+        ok, frame = self.cap.read()
+        self.position = index + 1
+        if not ok:
+            self.position = None
+            return None, None
+        self.rerendered += 1
+        return self.renderer.render_arrays(frame, width, self.settings['charset'], self.settings['colorize'],
+                                           self.settings.get('shape_aware', False))
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
 
 # ============================================================================
 # VIDEO PLAYER - COMPLETE IMPLEMENTATION
@@ -381,9 +925,13 @@ class UltimateVideoPlayer:
         # Color mode
         color_choice = console.input("\n🌈 Enable color? (y/n) [y]: ").lower().strip()
         settings['colorize'] = not color_choice.startswith('n')
+
+        # Glyph selection
+        shape_choice = console.input("🔷 Shape-aware glyph matching? (y/n) [n]: ").lower().strip()
+        settings['shape_aware'] = shape_choice.startswith('y')
         
         # Audio
-        if AUDIO_AVAILABLE:
+        if audio_available():
             audio_choice = console.input("🔊 Enable audio? (y/n) [y]: ").lower().strip()
             settings['audio'] = not audio_choice.startswith('n')
         else:
@@ -398,7 +946,7 @@ class UltimateVideoPlayer:
         cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
             console.print("❌ Failed to open video file")
-            return False, None, None, None
+            return False, None, None, None, None
         
         # Get video info
         fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
@@ -407,7 +955,7 @@ class UltimateVideoPlayer:
         if total_frames <= 0:
             console.print("❌ Cannot determine video length")
             cap.release()
-            return False, None, None, None
+            return False, None, None, None, None
         
         # Determine width
         if settings['auto_width']:
@@ -424,10 +972,14 @@ class UltimateVideoPlayer:
         console.print("🚀 Starting frame rendering...")
         
         # Pre-render with progress
-        frame_cache = []
+        memory_budget = parse_memory_size(settings.get('memory_budget', DEFAULT_MEMORY_BUDGET))
+        frame_cache = CompressedFrameStore(memory_budget)
         target_height = 0
+        budget_reached = False
         
-        if RICH_AVAILABLE:
+        if rich_available():
+            from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
+
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[bold blue]{task.description}"),
@@ -443,22 +995,20 @@ class UltimateVideoPlayer:
                     if not ret:
                         break
                     
-                    frame_data, height = self.renderer.render_frame(
-                        frame, width, settings['charset'], settings['colorize']
+                    glyphs, colors = self.renderer.render_arrays(
+                        frame, width, settings['charset'], settings['colorize'],
+                        settings.get('shape_aware', False)
                     )
                     
-                    if frame_data:
-                        frame_cache.append(frame_data)
-                        if not target_height and height > 0:
-                            target_height = height
+                    if glyphs is not None:
+                        if not frame_cache.append(glyphs, colors):
+                            budget_reached = True
+                            break
+                        if not target_height:
+                            target_height = glyphs.shape[0]
                     
                     frame_count += 1
                     progress.update(task, advance=1)
-                    
-                    # Safety limit
-                    if frame_count >= 5000:
-                        console.print("⚠️  Safety limit reached (5,000 frames)")
-                        break
         else:
             # Basic progress
             frame_count = 0
@@ -467,29 +1017,35 @@ class UltimateVideoPlayer:
                 if not ret:
                     break
                 
-                frame_data, height = self.renderer.render_frame(
-                    frame, width, settings['charset'], settings['colorize']
+                glyphs, colors = self.renderer.render_arrays(
+                    frame, width, settings['charset'], settings['colorize'],
+                    settings.get('shape_aware', False)
                 )
                 
-                if frame_data:
-                    frame_cache.append(frame_data)
-                    if not target_height and height > 0:
-                        target_height = height
+                if glyphs is not None:
+                    if not frame_cache.append(glyphs, colors):
+                        budget_reached = True
+                        break
+                    if not target_height:
+                        target_height = glyphs.shape[0]
                 
                 frame_count += 1
                 if frame_count % 100 == 0:
                     print(f"Rendered {frame_count}/{total_frames} frames...")
-                
-                if frame_count >= 5000:
-                    break
         
         cap.release()
         
-        if not frame_cache:
+        if not len(frame_cache):
             console.print("❌ No frames were successfully rendered")
-            return False, None, None, None
-            
+            return False, None, None, None, None
+
+        if budget_reached:
+            console.print(f"⚠️  Memory budget reached ({format_memory_size(memory_budget)}) "
+                          f"after {len(frame_cache)} frames")
         console.print(f"✅ Successfully rendered {len(frame_cache)} frames")
+        console.print(f"🗜️  Frame store: {format_memory_size(frame_cache.total_bytes)} "
+                      f"({format_memory_size(frame_cache.bytes_per_frame)}/frame, "
+                      f"{format_memory_size(frame_cache.raw_bytes_per_frame)} uncompressed)")
         return True, frame_cache, width, target_height, fps
 
     def play_video(self, video_path, frame_cache, width, height, fps, settings):
@@ -508,26 +1064,43 @@ class UltimateVideoPlayer:
         keyboard_handler.start()
         
         audio_player = None
-        if settings['audio'] and AUDIO_AVAILABLE:
+        if settings['audio'] and audio_available():
             try:
+                from ffpyplayer.player import MediaPlayer
                 audio_player = MediaPlayer(video_path)
             except Exception as e:
                 console.print(f"⚠️  Audio initialization failed: {e}")
         
         # Clear screen and setup
         os.system('cls' if os.name == 'nt' else 'clear')
-        sys.stdout.write('\033[?25l')  # Hide cursor
+        sys.stdout.write(HIDE_CURSOR)
         sys.stdout.flush()
+
+        resize_watcher = TerminalResizeWatcher().start()
+        pyramid = RenderPyramid(video_path, width, self.renderer, settings)
         
         try:
             frame_delay = 1.0 / fps
-            prev_frame = [[' ' for _ in range(width)] for _ in range(height)]
+            chars = ASCII_CHAR_SETS.get(settings['charset'], ASCII_CHAR_SETS["detailed"])
+            prev_glyphs = self._blank_glyphs(width, height, chars)
+            current_width = width
             start_time = time.time()
             frame_count = 0
             
-            for frame_data in frame_cache:
+            for index, (glyphs, colors) in enumerate(frame_cache):
                 if not self.state.is_running:
                     break
+
+                # Terminal resized: switch pyramid level and repaint from scratch
+                size = resize_watcher.poll()
+                if size:
+                    current_width = pyramid.level_for(size.columns)
+                    prev_glyphs = None
+                glyphs, colors = pyramid.frame(index, glyphs, colors, current_width)
+                if prev_glyphs is None:
+                    sys.stdout.write(CLEAR_SCREEN)
+                    height = glyphs.shape[0]
+                    prev_glyphs = self._blank_glyphs(current_width, height, chars)
                 
                 # Handle pause state
                 while self.state.is_paused and self.state.is_running:
@@ -541,8 +1114,7 @@ class UltimateVideoPlayer:
                     break
                 
                 # Clear pause indicator
-                sys.stdout.write(f"\033[{height + 2};1H")
-                sys.stdout.write(" " * 50)
+                sys.stdout.write(self._status_line_clear(height))
                 
                 frame_start = time.time()
                 
@@ -554,18 +1126,11 @@ class UltimateVideoPlayer:
                         pass
                 
                 # Differential update for smooth playback
-                output_buffer = []
-                for y, row in enumerate(frame_data):
-                    for x, (char, color) in enumerate(row):
-                        if char != prev_frame[y][x]:
-                            output_buffer.append(f"\033[{y + 1};{x + 1}H")
-                            r, g, b = color
-                            output_buffer.append(f"\033[38;2;{r};{g};{b}m{char}")
-                            prev_frame[y][x] = char
-                
+                output, _ = self._build_frame_update(glyphs, colors, prev_glyphs, chars)
+
                 # Write frame
-                if output_buffer:
-                    sys.stdout.write("".join(output_buffer))
+                if output:
+                    sys.stdout.write(output)
                     sys.stdout.flush()
                 
                 # Control playback speed
@@ -586,6 +1151,8 @@ class UltimateVideoPlayer:
             # Cleanup
             self.state.stop()
             keyboard_handler.stop()
+            resize_watcher.stop()
+            pyramid.release()
             if audio_player:
                 try:
                     audio_player.close_player()
@@ -593,9 +1160,212 @@ class UltimateVideoPlayer:
                     pass
             
             # Reset terminal
-            sys.stdout.write("\033[?25h\033[0m\033[H\033[J")
+            sys.stdout.write(RESET_TERMINAL)
             sys.stdout.flush()
 
+    def play_headless(self, frame_cache, width, height, fps, charset, output, cast=False, realtime=False):
+        """Run the playback pipeline without a TTY, writing the escape stream to output.
+
+        output is a path, a pipe, or '-' for stdout. With cast=True the stream is
+        wrapped as an asciinema v2 recording. Returns playback statistics.
+        """
+        # Real-time output is watched as it is written; maximum speed only flushes at the end
+        out = EscapeStream(output, cast, width, height + 2, flush=realtime)
+
+        frame_delay = 1.0 / fps
+        chars = ASCII_CHAR_SETS.get(charset, ASCII_CHAR_SETS["detailed"])
+        prev_glyphs = self._blank_glyphs(width, height, chars)
+        stats = {'frames': 0, 'changed_cells': 0}
+        start_time = time.time()
+
+        try:
+            out.write(CLEAR_SCREEN + HIDE_CURSOR, 0.0)
+            for glyphs, colors in frame_cache:
+                frame_start = time.time()
+                update, changed = self._build_frame_update(glyphs, colors, prev_glyphs, chars)
+
+                # Real-time mode stamps wall-clock, max-speed mode the presentation time
+                if realtime:
+                    timestamp = frame_start - start_time
+                else:
+                    timestamp = stats['frames'] * frame_delay
+                out.write(self._status_line_clear(height) + update, timestamp)
+
+                stats['frames'] += 1
+                stats['changed_cells'] += changed
+
+                if realtime:
+                    wait_time = frame_delay - (time.time() - frame_start)
+                    if wait_time > 0:
+                        time.sleep(wait_time)
+
+            end_stamp = time.time() - start_time if realtime else stats['frames'] * frame_delay
+            out.write(RESET_TERMINAL, end_stamp)
+        finally:
+            out.close()
+
+        stats['bytes'] = out.bytes
+        stats['elapsed'] = time.time() - start_time
+        stats['fps'] = stats['frames'] / stats['elapsed'] if stats['elapsed'] > 0 else 0.0
+        stats['bytes_per_frame'] = stats['bytes'] / stats['frames'] if stats['frames'] else 0.0
+        total_cells = width * height * stats['frames']
+        stats['changed_ratio'] = stats['changed_cells'] / total_cells if total_cells else 0.0
+        return stats
+
+    def play_live(self, source, settings, output=None, cast=False, duration=None):
+        """Render a live source, always showing the newest frame and dropping stale ones.
+
+        Writes to the terminal, or to output ('-' for stdout) without a TTY.
+        Returns statistics including latency from capture (V4L2 buffer
+        timestamps) or from decode (other sources) to the terminal.
+        """
+        cap = open_live_source(source)
+        if not cap.isOpened():
+            console.print(f"❌ Cannot open live source: {source}")
+            return None
+
+        pace_fps = (cap.get(cv2.CAP_PROP_FPS) or 30.0) if os.path.isfile(source) else None
+        grabber = LatestFrameGrabber(cap, pace_fps).start()
+
+        if settings['auto_width']:
+            width = max(60, int(shutil.get_terminal_size().columns * 0.85))
+        else:
+            width = settings['width']
+        chars = ASCII_CHAR_SETS.get(settings['charset'], ASCII_CHAR_SETS["detailed"])
+
+        keyboard_handler = None
+        resize_watcher = None
+        if output is None:
+            keyboard_handler = KeyboardHandler(self.state)
+            keyboard_handler.start()
+            resize_watcher = TerminalResizeWatcher().start()
+            os.system('cls' if os.name == 'nt' else 'clear')
+
+        # Header height is not known before the first frame; use the terminal size
+        out = EscapeStream(output, cast, width, shutil.get_terminal_size().lines)
+
+        stats = {'frames': 0, 'changed_cells': 0, 'cells': 0, 'latencies': []}
+        start_time = time.monotonic()
+        prev_glyphs = None
+
+        try:
+            out.write(HIDE_CURSOR, 0.0)
+            while self.state.is_running:
+                if duration and time.monotonic() - start_time >= duration:
+                    break
+                frame, grab_time = grabber.newest()
+                if frame is None:
+                    if grabber.finished:
+                        break
+                    continue
+                if self.state.is_paused:
+                    continue
+
+                # Every frame is rendered fresh, so a resize only changes the width
+                size = resize_watcher.poll() if resize_watcher else None
+                if size:
+                    width = playback_width(size.columns, settings)
+                    prev_glyphs = None
+
+                glyphs, colors = self.renderer.render_arrays(frame, width, settings['charset'], settings['colorize'],
+                                                             settings.get('shape_aware', False))
+                if glyphs is None:
+                    continue
+
+                # Source or terminal resolution changed (or first frame): repaint everything
+                prefix = ""
+                if prev_glyphs is None or prev_glyphs.shape != glyphs.shape:
+                    prev_glyphs = self._blank_glyphs(width, glyphs.shape[0], chars)
+                    prefix = CLEAR_SCREEN
+
+                update, changed = self._build_frame_update(glyphs, colors, prev_glyphs, chars)
+                out.write(prefix + update, time.monotonic() - start_time)
+
+                stats['latencies'].append(time.monotonic() - grab_time)
+                stats['frames'] += 1
+                stats['changed_cells'] += changed
+                stats['cells'] += glyphs.size
+        except KeyboardInterrupt:
+            pass
+        finally:
+            grabber.stop()
+            if keyboard_handler:
+                keyboard_handler.stop()
+            if resize_watcher:
+                resize_watcher.stop()
+            out.write(RESET_TERMINAL, time.monotonic() - start_time)
+            out.close()
+
+        latencies = sorted(stats.pop('latencies'))
+        stats['bytes'] = out.bytes
+        stats['elapsed'] = time.monotonic() - start_time
+        stats['fps'] = stats['frames'] / stats['elapsed'] if stats['elapsed'] > 0 else 0.0
+        stats['captured'] = grabber.captured
+        stats['dropped'] = grabber.dropped
+        stats['latency_origin'] = grabber.latency_origin
+        stats['bytes_per_frame'] = stats['bytes'] / stats['frames'] if stats['frames'] else 0.0
+        stats['changed_ratio'] = stats['changed_cells'] / stats['cells'] if stats['cells'] else 0.0
+        if latencies:
+            stats['latency_ms'] = {
+                'mean': 1000 * sum(latencies) / len(latencies),
+                'p50': 1000 * latencies[len(latencies) // 2],
+                'p95': 1000 * latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                'max': 1000 * latencies[-1],
+            }
+        return stats
+
+    def show_live_report(self, stats):
+        console.print(f"\n✅ Live session: {stats['frames']} frames shown in {stats['elapsed']:.1f}s "
+                      f"({stats['fps']:.1f} frames/s)")
+        console.print(f"📥 Captured {stats['captured']} frames, dropped {stats['dropped']} stale frames")
+        console.print(f"📦 Stream: {stats['bytes_per_frame']:.0f} bytes/frame, "
+                      f"{stats['changed_ratio']:.1%} cells changed")
+        latency = stats.get('latency_ms')
+        if latency:
+            if stats['latency_origin'] == "capture":
+                label = "Capture-to-terminal latency"
+            else:
+                label = "Decode-to-terminal latency (excludes backend and network buffering)"
+            console.print(f"⏱️  {label}: mean {latency['mean']:.1f} ms, "
+                          f"p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, max {latency['max']:.1f} ms")
+
+    def show_headless_report(self, stats, output):
+        console.print(f"\n✅ Headless render complete: {stats['frames']} frames in {stats['elapsed']:.2f}s")
+        console.print(f"⚡ Throughput: {stats['fps']:.1f} frames/s")
+        console.print(f"📦 Stream: {stats['bytes']} bytes ({stats['bytes_per_frame']:.0f} bytes/frame)")
+        console.print(f"🔁 Changed cells: {stats['changed_ratio']:.1%}")
+        if output != '-':
+            console.print(f"💾 Output saved to: {output}")
+
+    @staticmethod
+    def _status_line_clear(height):
+        """Escape sequence that blanks the pause indicator line below the frame"""
+        return f"\033[{height + 2};1H" + " " * 50
+
+    @staticmethod
+    def _blank_glyphs(width, height, chars):
+        """Diff state for an empty screen: every cell holds a space"""
+        blank = chars.index(' ') if ' ' in chars else -1
+        return np.full((height, width), blank, dtype=np.int16)
+
+    def _build_frame_update(self, glyphs, colors, prev_glyphs, chars):
+        """Build the escape sequence for cells whose glyph changed since prev_glyphs.
+
+        Updates prev_glyphs in place and returns (output, changed_cells).
+        """
+        changed = glyphs != prev_glyphs
+        ys, xs = np.nonzero(changed)
+        if not len(ys):
+            return "", 0
+
+        prev_glyphs[changed] = glyphs[changed]
+        output_buffer = [
+            f"\033[{y + 1};{x + 1}H\033[38;2;{r};{g};{b}m{chars[index]}"
+            for y, x, index, (r, g, b) in zip(ys.tolist(), xs.tolist(),
+                                              glyphs[ys, xs].tolist(), colors[ys, xs].tolist())
+        ]
+        return "".join(output_buffer), len(output_buffer)
+
     def run_player(self):
         """Main player workflow"""
         video_path = self.get_video_file()
@@ -608,6 +1378,208 @@ class UltimateVideoPlayer:
         if success:
             self.play_video(video_path, frame_cache, width, height, fps, settings)
 
+# ============================================================================
+# VIDEO WALL - TILED MULTI-STREAM PLAYBACK
+# ============================================================================
+
+class WallTile:
+    """One stream on the wall: its own decoder, position and latest rendered arrays"""
+    def __init__(self, source, index):
+        self.source = source
+        self.index = index
+        self.cap = cv2.VideoCapture(source)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        source_width = self.cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 16
+        source_height = self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 9
+        self.aspect = source_height / source_width
+        self.position = 0
+        # Frames played in earlier passes of a looping clip
+        self.loop_offset = 0
+        self.finished = False
+        self.glyphs = None
+        self.colors = None
+        self.x = self.y = 0
+        self.width = 0
+        self.rendered = 0
+        self.cpu_seconds = 0.0
+
+    def advance(self, target_frame, renderer, settings, loop):
+        """Decode up to target_frame (skipping decode of frames in between) and render it.
+
+        target_frame counts from the start of playback; when looping it is
+        mapped into the current pass. Runs on the shared pool. Returns True if
+        the tile has a new frame.
+        """
+        target_frame -= self.loop_offset
+        if self.position > target_frame:
+            return False
+        cpu_start = time.thread_time()
+        frame = None
+        try:
+            while self.position <= target_frame:
+                # Only the last frame before the target needs a full decode
+                if self.position < target_frame:
+                    ok = self.cap.grab()
+                else:
+                    ok, frame = self.cap.read()
+                if not ok:
+                    if not loop or self.position == 0:
+                        self.finished = True
+                        return False
+                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    self.loop_offset += self.position
+                    target_frame -= self.position
+                    self.position = 0
+                    continue
+                self.position += 1
+
+            glyphs, colors = renderer.render_arrays(frame, self.width, settings['charset'],
+                                                    settings['colorize'], settings.get('shape_aware', False))
+            if glyphs is None:
+                return False
+            self.glyphs, self.colors = glyphs, colors
+            self.rendered += 1
+            return True
+        finally:
+            self.cpu_seconds += time.thread_time() - cpu_start
+
+    def release(self):
+        self.cap.release()
+
+class VideoWall:
+    """Plays N videos tiled in a grid through one frame buffer.
+
+    Streams decode independently and render on a shared thread pool; their
+    glyph and colour arrays are composed into one canvas so every refresh is
+    a single diff pass and a single write.
+    """
+    def __init__(self, sources, settings, columns=None, size=None, workers=None):
+        self.player = UltimateVideoPlayer()
+        self.settings = settings
+        self.chars = ASCII_CHAR_SETS.get(settings['charset'], ASCII_CHAR_SETS["detailed"])
+        self.tiles = [WallTile(source, index) for index, source in enumerate(sources)]
+        # Sources that exist but cannot be decoded would otherwise stay blank tiles
+        self.failed_sources = [tile.source for tile in self.tiles if not tile.cap.isOpened()]
+        self.workers = workers or min(len(self.tiles), os.cpu_count() or 1)
+
+        terminal = shutil.get_terminal_size()
+        self.width, self.height = size or (terminal.columns, terminal.lines - 1)
+        self.columns = columns or math.ceil(math.sqrt(len(self.tiles)))
+        self.layout()
+
+    def layout(self):
+        """Assign each tile a grid cell and the widest render that fits it"""
+        rows = math.ceil(len(self.tiles) / self.columns)
+        cell_width = (self.width - (self.columns - 1)) // self.columns
+        cell_height = (self.height - (rows - 1)) // rows
+        for tile in self.tiles:
+            row, column = divmod(tile.index, self.columns)
+            # render_arrays uses height = width * aspect * 0.5
+            tile.width = max(1, min(cell_width, int(cell_height / (tile.aspect * 0.5))))
+            tile_height = int(tile.width * tile.aspect * 0.5)
+            tile.x = column * (cell_width + 1) + (cell_width - tile.width) // 2
+            tile.y = row * (cell_height + 1) + (cell_height - tile_height) // 2
+
+    def compose(self, canvas_glyphs, canvas_colors):
+        for tile in self.tiles:
+            if tile.glyphs is None:
+                continue
+            # Clip in case the rendered height rounds past the cell
+            rows = min(tile.glyphs.shape[0], self.height - tile.y)
+            columns = min(tile.glyphs.shape[1], self.width - tile.x)
+            canvas_glyphs[tile.y:tile.y + rows, tile.x:tile.x + columns] = tile.glyphs[:rows, :columns]
+            canvas_colors[tile.y:tile.y + rows, tile.x:tile.x + columns] = tile.colors[:rows, :columns]
+
+    def run(self, output=None, cast=False, realtime=True, duration=None, loop=False):
+        """Play the wall on the terminal, or write the escape stream to output.
+
+        Without realtime, refreshes run back to back on a virtual clock.
+        Returns refresh statistics.
+        """
+        refresh_fps = max(tile.fps for tile in self.tiles)
+        refresh_delay = 1.0 / refresh_fps
+        state = self.player.state
+
+        keyboard_handler = None
+        if output is None:
+            keyboard_handler = KeyboardHandler(state)
+            keyboard_handler.start()
+            os.system('cls' if os.name == 'nt' else 'clear')
+
+        out = EscapeStream(output, cast, self.width, self.height + 1, flush=realtime)
+
+        blank = self.chars.index(' ') if ' ' in self.chars else 0
+        canvas_glyphs = np.full((self.height, self.width), blank, dtype=np.uint8)
+        canvas_colors = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        prev_glyphs = self.player._blank_glyphs(self.width, self.height, self.chars)
+
+        stats = {'refreshes': 0, 'changed_cells': 0}
+        tick = 0
+        start_time = time.monotonic()
+        cpu_start = time.process_time()
+
+        try:
+            out.write(HIDE_CURSOR, 0.0)
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                while state.is_running:
+                    clock = time.monotonic() - start_time if realtime else tick * refresh_delay
+                    tick += 1
+                    if duration and clock >= duration:
+                        break
+                    active = [tile for tile in self.tiles if not tile.finished]
+                    if not active:
+                        break
+                    if state.is_paused:
+                        time.sleep(0.1)
+                        continue
+
+                    futures = [pool.submit(tile.advance, int(clock * tile.fps + 1e-6), self.player.renderer,
+                                           self.settings, loop) for tile in active]
+                    if any([future.result() for future in futures]) or not stats['refreshes']:
+                        self.compose(canvas_glyphs, canvas_colors)
+                        update, changed = self.player._build_frame_update(canvas_glyphs, canvas_colors,
+                                                                          prev_glyphs, self.chars)
+                        out.write(update, clock)
+                        stats['refreshes'] += 1
+                        stats['changed_cells'] += changed
+
+                    if realtime:
+                        next_refresh = (int(clock / refresh_delay) + 1) * refresh_delay
+                        time.sleep(max(0.0, start_time + next_refresh - time.monotonic()))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            for tile in self.tiles:
+                tile.release()
+            if keyboard_handler:
+                keyboard_handler.stop()
+            out.write(RESET_TERMINAL, time.monotonic() - start_time)
+            out.close()
+
+        refreshes = max(1, stats['refreshes'])
+        stats['bytes'] = out.bytes
+        stats['elapsed'] = time.monotonic() - start_time
+        stats['bytes_per_refresh'] = stats['bytes'] / refreshes
+        stats['changed_ratio'] = stats['changed_cells'] / (refreshes * self.width * self.height)
+        stats['cpu_ms_per_refresh'] = 1000 * (time.process_time() - cpu_start) / refreshes
+        stats['streams'] = [
+            {'source': tile.source, 'width': tile.width, 'rendered': tile.rendered,
+             'cpu_ms_per_frame': 1000 * tile.cpu_seconds / max(1, tile.rendered)}
+            for tile in self.tiles
+        ]
+        return stats
+
+    @staticmethod
+    def show_report(stats):
+        console.print(f"\n✅ Wall: {stats['refreshes']} refreshes in {stats['elapsed']:.1f}s")
+        console.print(f"📦 {stats['bytes_per_refresh']:.0f} bytes/refresh, {stats['changed_ratio']:.1%} cells changed")
+        console.print(f"⚙️  CPU: {stats['cpu_ms_per_refresh']:.1f} ms/refresh total")
+        for stream in stats['streams']:
+            console.print(f"   🎥 {os.path.basename(stream['source'])}: {stream['width']} cols, "
+                          f"{stream['rendered']} frames, {stream['cpu_ms_per_frame']:.1f} ms CPU/frame")
+            if not stream['rendered']:
+                console.print(f"   ⚠️  {os.path.basename(stream['source'])} produced no frames")
+
 # ============================================================================
 # VIDEO CONVERTER - COMPLETE IMPLEMENTATION
 # ============================================================================
@@ -674,16 +1646,32 @@ class UltimateVideoConverter:
         # Color mode
         color_choice = console.input("\n🌈 Enable color in output? (y/n) [y]: ").lower().strip()
         settings['colorize'] = not color_choice.startswith('n')
+
+        # Glyph selection
+        shape_choice = console.input("🔷 Shape-aware glyph matching? (y/n) [n]: ").lower().strip()
+        settings['shape_aware'] = shape_choice.startswith('y')
+
+        # Audio passthrough
+        audio_choice = console.input("🔊 Copy source audio into the output? (y/n) [y]: ").lower().strip()
+        settings['audio'] = not audio_choice.startswith('n')
         
         # Output path
         default_output = "converted_ascii_video.avi"
         output_path = console.input(f"💾 Output file [{default_output}]: ").strip()
         settings['output'] = output_path if output_path else default_output
+
+        # Parallel segments
+        workers = console.input(f"⚙️  Worker processes (1-{os.cpu_count() or 1}) [1]: ").strip()
+        settings['workers'] = int(workers) if workers.isdigit() and int(workers) > 0 else 1
+        settings['checkpoint_every'] = None
         
         console.print("✅ Conversion settings saved!")
         return settings
 
     def convert_video(self, video_path, settings):
+        if settings.get('workers', 1) > 1:
+            return self.convert_video_segmented(video_path, settings)
+
         console.print("\n🚀 Starting video conversion...")
         
         cap = cv2.VideoCapture(video_path)
@@ -699,15 +1687,29 @@ class UltimateVideoConverter:
             console.print("❌ Cannot determine video length")
             cap.release()
             return False
+
+        # Long sources are written in checkpointed segments so a crash can resume.
+        # By default only with ffmpeg: without it joining re-encodes every frame.
+        checkpoint_every = settings.get('checkpoint_every')
+        if checkpoint_every is None:
+            if shutil.which("ffmpeg"):
+                checkpoint_every = CHECKPOINT_SECONDS
+            else:
+                checkpoint_every = 0
+                if total_frames > fps * CHECKPOINT_SECONDS:
+                    console.print("⚠️  ffmpeg not found - converting in one pass without resumable checkpoints")
+        checkpoint_frames = int(fps * checkpoint_every)
+        if 0 < checkpoint_frames < total_frames:
+            cap.release()
+            return self.convert_video_checkpointed(video_path, settings, fps, total_frames, checkpoint_frames)
         
         console.print(f"📊 Source: {total_frames} frames @ {fps:.1f} FPS")
         console.print(f"🎯 Target: {settings['width']}x{settings['height']}")
         console.print(f"💾 Output: {settings['output']}")
         
         # Setup video writer
-        fourcc = cv2.VideoWriter_fourcc(*'MJPG')
-        out = cv2.VideoWriter(settings['output'], fourcc, fps, 
-                            (settings['width'], settings['height']))
+        audio_source = video_path if settings.get('audio', True) else None
+        out = open_video_writer(settings['output'], fps, (settings['width'], settings['height']), audio_source)
         
         if not out.isOpened():
             console.print("❌ Failed to create output video file")
@@ -718,7 +1720,9 @@ class UltimateVideoConverter:
             start_time = time.time()
             frame_count = 0
             
-            if RICH_AVAILABLE:
+            if rich_available():
+                from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
+
                 with Progress(
                     SpinnerColumn(),
                     TextColumn("[bold green]{task.description}"),
@@ -733,16 +1737,8 @@ class UltimateVideoConverter:
                         if not ret:
                             break
                         
-                        # Render ASCII frame
-                        ascii_data, _ = self.renderer.render_frame(
-                            frame, settings['width'], settings['charset'], settings['colorize']
-                        )
-                        
-                        # Convert ASCII to image
-                        ascii_image = self.ascii_to_image(ascii_data, settings['width'], settings['height'])
-                        
-                        # Write frame
-                        out.write(ascii_image)
+                        # Render ASCII frame and write it
+                        out.write(self.render_output_frame(frame, settings))
                         frame_count += 1
                         progress.update(task, advance=1)
             else:
@@ -753,12 +1749,7 @@ class UltimateVideoConverter:
                     if not ret:
                         break
                     
-                    ascii_data, _ = self.renderer.render_frame(
-                        frame, settings['width'], settings['charset'], settings['colorize']
-                    )
-                    
-                    ascii_image = self.ascii_to_image(ascii_data, settings['width'], settings['height'])
-                    out.write(ascii_image)
+                    out.write(self.render_output_frame(frame, settings))
                     frame_count += 1
                     
                     if frame_count % 100 == 0:
@@ -786,6 +1777,14 @@ class UltimateVideoConverter:
                 pass
             return False
 
+    def render_output_frame(self, frame, settings):
+        """Render one source frame to an ASCII output image"""
+        ascii_data, _ = self.renderer.render_frame(
+            frame, settings['width'], settings['charset'], settings['colorize'],
+            settings.get('shape_aware', False)
+        )
+        return self.ascii_to_image(ascii_data, settings['width'], settings['height'])
+
     def ascii_to_image(self, ascii_data, width, height):
         """Convert ASCII data to OpenCV image"""
         # Create blank image
@@ -844,6 +1843,200 @@ class UltimateVideoConverter:
                 # Fallback: draw a simple rectangle
                 cv2.rectangle(img, (x, y), (x + width, y + height), (b, g, r), -1)
 
+    def export_video(self, video_path, settings, fmt=None):
+        """Stream rendered frames into an HTML, text, ANSI, GIF or APNG exporter.
+
+        Returns statistics (frames, seconds, output bytes) or None on failure.
+        """
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            console.print("❌ Failed to open video file")
+            return None
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+        try:
+            exporter = create_exporter(settings['output'], settings['charset'], fps, fmt)
+        except (ValueError, RuntimeError) as e:
+            console.print(f"❌ {e}")
+            cap.release()
+            return None
+
+        console.print(f"\n🚀 Exporting {settings['columns']}-column ASCII to {settings['output']}...")
+        start_time = time.time()
+        frame_count = 0
+        try:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                glyphs, colors = self.renderer.render_arrays(
+                    frame, settings['columns'], settings['charset'], settings['colorize'],
+                    settings.get('shape_aware', False)
+                )
+                if glyphs is None:
+                    continue
+                exporter.write_frame(glyphs, colors)
+                frame_count += 1
+                if frame_count % 100 == 0:
+                    console.print(f"Exported {frame_count} frames - {time.time() - start_time:.1f}s")
+        finally:
+            exporter.close()
+            cap.release()
+
+        stats = {
+            'frames': frame_count,
+            'seconds': time.time() - start_time,
+            'bytes': os.path.getsize(settings['output']) if os.path.exists(settings['output']) else 0,
+        }
+        console.print(f"✅ Exported {frame_count} frames in {stats['seconds']:.1f}s "
+                      f"({format_memory_size(stats['bytes'])})")
+        return stats
+
+    def convert_video_checkpointed(self, video_path, settings, fps, total_frames, checkpoint_frames):
+        """Convert sequentially, persisting a checkpoint every checkpoint_frames.
+
+        Each checkpoint closes an output segment in <output>.parts/ and records
+        it in the manifest with the resume frame and settings. Running the same
+        conversion again seeks to the last checkpoint instead of starting over.
+        """
+        workdir = settings['output'] + ".parts"
+        job = SegmentedJob.load_or_plan(workdir, video_path, settings, total_frames, fps,
+                                        checkpoint_frames, align_keyframes=False)
+        pending = job.pending()
+        resume_frame = pending[0]['start'] if pending else total_frames
+
+        console.print(f"📊 Source: {total_frames} frames @ {fps:.1f} FPS")
+        console.print(f"🎯 Target: {settings['width']}x{settings['height']}")
+        console.print(f"💾 Output: {settings['output']}")
+        console.print(f"📍 Checkpoint every {checkpoint_frames} frames")
+        if resume_frame > 0:
+            console.print(f"⏩ Resuming from frame {resume_frame}/{total_frames}")
+
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            console.print("❌ Failed to open video file")
+            return False
+
+        start_time = time.time()
+        frame_count = 0
+        position = 0
+
+        def convert_segment(segment, on_frame=None):
+            nonlocal position
+            # Pending segments are not contiguous when a --workers run left gaps
+            if position != segment['start']:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, segment['start'])
+            finished = write_segment(cap, self, settings, fps, segment, workdir, on_frame=on_frame)
+            position = segment['start'] + finished['frames']
+            job.mark_done(finished)
+            return finished
+
+        try:
+            if rich_available():
+                from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
+
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold green]{task.description}"),
+                    BarColumn(bar_width=40),
+                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                    TimeRemainingColumn(),
+                ) as progress:
+                    task = progress.add_task("🎨 Converting frames to ASCII...",
+                                             total=total_frames, completed=resume_frame)
+                    for segment in pending:
+                        finished = convert_segment(segment, on_frame=lambda: progress.update(task, advance=1))
+                        frame_count += finished['frames']
+            else:
+                for segment in pending:
+                    finished = convert_segment(segment)
+                    frame_count += finished['frames']
+                    elapsed = time.time() - start_time
+                    console.print(f"📍 Checkpoint: {segment['end']}/{total_frames} frames - {elapsed:.1f}s")
+
+            cap.release()
+            console.print("🔗 Joining segments...")
+            if not concat_segments(job.segment_paths(), settings['output'], fps,
+                                   (settings['width'], settings['height']),
+                                   video_path if settings.get('audio', True) else None):
+                console.print("❌ Failed to join segments")
+                return False
+        except Exception as e:
+            console.print(f"❌ Conversion error: {e}")
+            console.print(f"💡 Re-run the same command to resume from frame {job.manifest['resume_frame']}")
+            cap.release()
+            return False
+
+        job.cleanup()
+        total_time = time.time() - start_time
+        console.print(f"\n✅ Conversion complete!")
+        console.print(f"📊 Processed {frame_count} frames in {total_time:.1f}s")
+        console.print(f"💾 Output saved to: {settings['output']}")
+        return True
+
+    def convert_video_segmented(self, video_path, settings):
+        """Convert independent time segments in parallel and join them losslessly.
+
+        Finished segments are recorded in a manifest next to the output, so
+        re-running the same conversion after a crash only redoes the
+        unfinished segments.
+        """
+        console.print("\n🚀 Starting segmented video conversion...")
+
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            console.print("❌ Failed to open video file")
+            return False
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        cap.release()
+
+        if total_frames <= 0:
+            console.print("❌ Cannot determine video length")
+            return False
+
+        workers = settings['workers']
+        workdir = settings['output'] + ".parts"
+        segment_frames = min(int(fps * SEGMENT_SECONDS), -(-total_frames // workers))
+        job = SegmentedJob.load_or_plan(workdir, video_path, settings, total_frames, fps, segment_frames)
+        pending = job.pending()
+
+        console.print(f"📊 Source: {total_frames} frames @ {fps:.1f} FPS")
+        console.print(f"🧩 Segments: {len(job.segments)} ({len(job.segments) - len(pending)} already done)")
+        console.print(f"⚙️  Workers: {workers}")
+
+        start_time = time.time()
+        try:
+            if pending:
+                from concurrent.futures import ProcessPoolExecutor, as_completed
+
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(_convert_segment, video_path, settings, fps, segment, workdir)
+                               for segment in pending]
+                    for done_count, future in enumerate(as_completed(futures), 1):
+                        segment = future.result()
+                        job.mark_done(segment)
+                        console.print(f"✅ Segment {segment['index'] + 1}/{len(job.segments)} "
+                                      f"({segment['frames']} frames) - {done_count}/{len(pending)} this run")
+
+            console.print("🔗 Joining segments...")
+            if not concat_segments(job.segment_paths(), settings['output'], fps,
+                                   (settings['width'], settings['height']),
+                                   video_path if settings.get('audio', True) else None):
+                console.print("❌ Failed to join segments")
+                return False
+        except Exception as e:
+            console.print(f"❌ Conversion error: {e}")
+            console.print(f"💡 Re-run the same command to resume from {workdir}")
+            return False
+
+        job.cleanup()
+        total_time = time.time() - start_time
+        console.print(f"\n✅ Conversion complete!")
+        console.print(f"📊 Processed {len(pending)} segments in {total_time:.1f}s")
+        console.print(f"💾 Output saved to: {settings['output']}")
+        return True
+
     def get_video_file(self):
         """Reuse the same video file selector as player"""
         console.print("\n📁 Please enter the path to your video file:")
@@ -889,6 +2082,710 @@ class UltimateVideoConverter:
         else:
             console.print("\n❌ Conversion failed!")
 
+# ============================================================================
+# AUDIO PASSTHROUGH - STREAM COPY INTO THE OUTPUT CONTAINER
+# ============================================================================
+
+# MJPEG settings matching what OpenCV's MJPG writer produces
+MUX_VIDEO_ARGS = ["-c:v", "mjpeg", "-pix_fmt", "yuvj420p", "-q:v", "3"]
+
+def source_has_audio(video_path):
+    """True if ffprobe (or ffmpeg, when ffprobe is missing) finds an audio stream"""
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe:
+        result = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "a", "-show_entries", "stream=index",
+             "-of", "csv=p=0", video_path],
+            capture_output=True, text=True,
+        )
+        return result.returncode == 0 and bool(result.stdout.strip())
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        # ffmpeg exits non-zero without an output file but still prints the stream list
+        result = subprocess.run([ffmpeg, "-hide_banner", "-i", video_path], capture_output=True, text=True)
+        return "Audio:" in result.stderr
+    return False
+
+class MuxingVideoWriter:
+    """cv2.VideoWriter stand-in that also copies the source audio into the output.
+
+    Rendered frames are piped to ffmpeg as raw BGR at the source frame rate,
+    so frame n is stamped n / fps exactly as in the video-only output, and
+    JPEG encoding runs in the ffmpeg process. The audio stream is copied from
+    the source (no transcode) and muxed while the frames are written.
+    """
+    def __init__(self, output, fps, size, audio_source):
+        self.output = output
+        self.process = subprocess.Popen(
+            [shutil.which("ffmpeg"), "-y", "-v", "error",
+             "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{size[0]}x{size[1]}",
+             "-framerate", f"{fps}", "-i", "pipe:0",
+             "-i", audio_source,
+             "-map", "0:v", "-map", "1:a", *MUX_VIDEO_ARGS, "-c:a", "copy", output],
+            stdin=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+
+    def isOpened(self):
+        return self.process.poll() is None
+
+    def write(self, image):
+        try:
+            self.process.stdin.write(image.tobytes())
+        except BrokenPipeError:
+            self.release()
+
+    def release(self):
+        """Finish the file; raises RuntimeError with ffmpeg's message if muxing failed"""
+        if self.process.returncode is not None:
+            return
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        error = self.process.stderr.read().decode('utf-8', 'replace').strip()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg muxing failed: {error}")
+
+def open_video_writer(output, fps, size, audio_source=None):
+    """MJPEG writer for converter output, copying audio from audio_source when possible.
+
+    Falls back to a video-only cv2.VideoWriter when ffmpeg is missing or the
+    source has no audio.
+    """
+    if audio_source:
+        if not shutil.which("ffmpeg"):
+            console.print("⚠️  ffmpeg not found - writing video only (source audio is not copied)")
+        elif source_has_audio(audio_source):
+            console.print("🔊 Copying source audio into the output")
+            return MuxingVideoWriter(output, fps, size, audio_source)
+    return cv2.VideoWriter(output, cv2.VideoWriter_fourcc(*'MJPG'), fps, size)
+
+# ============================================================================
+# SEGMENTED CONVERSION - PARALLEL WORKERS, RESUMABLE
+# ============================================================================
+
+SEGMENT_SECONDS = 60
+CHECKPOINT_SECONDS = 60
+
+def source_fingerprint(video_path):
+    """Identify a source file well enough to detect that it changed"""
+    stat = os.stat(video_path)
+    return {'path': os.path.abspath(video_path), 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+def find_keyframes(video_path, fps):
+    """Return sorted keyframe frame indices via ffprobe, or None if unavailable"""
+    ffprobe = shutil.which("ffprobe")
+    if not ffprobe:
+        return None
+    try:
+        result = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "v:0",
+             "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", video_path],
+            capture_output=True, text=True, timeout=120, check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    keyframes = set()
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' in flags and pts_time not in ('', 'N/A'):
+            keyframes.add(int(round(float(pts_time) * fps)))
+    return sorted(keyframes) or None
+
+def plan_segments(total_frames, target, keyframes=None):
+    """Split [0, total_frames) into ranges of about target frames, starting each on a keyframe when known"""
+    target = max(1, target)
+    boundaries = [0]
+    while boundaries[-1] + target < total_frames:
+        wanted = boundaries[-1] + target
+        if keyframes:
+            # Nearest keyframe after the previous boundary
+            candidates = [k for k in keyframes if boundaries[-1] < k < total_frames]
+            if not candidates:
+                break
+            wanted = min(candidates, key=lambda k: abs(k - wanted))
+        boundaries.append(wanted)
+    boundaries.append(total_frames)
+
+    return [{'index': i, 'start': start, 'end': end}
+            for i, (start, end) in enumerate(zip(boundaries, boundaries[1:]))]
+
+class SegmentedJob:
+    """Manifest of a segmented conversion kept in <output>.parts/"""
+    MANIFEST = "manifest.json"
+
+    def __init__(self, workdir, manifest):
+        self.workdir = workdir
+        self.manifest = manifest
+
+    @classmethod
+    def load_or_plan(cls, workdir, video_path, settings, total_frames, fps, segment_frames, align_keyframes=True):
+        fingerprint = source_fingerprint(video_path)
+        job_settings = {key: settings[key] for key in ('width', 'height', 'charset', 'colorize')}
+        job_settings['shape_aware'] = settings.get('shape_aware', False)
+        manifest_path = os.path.join(workdir, cls.MANIFEST)
+
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, encoding='utf-8') as f:
+                    manifest = json.load(f)
+                if manifest.get('source') == fingerprint and manifest.get('settings') == job_settings:
+                    # Drop half-written files from the interrupted run
+                    for name in os.listdir(workdir):
+                        if name.startswith("tmp"):
+                            os.remove(os.path.join(workdir, name))
+                    return cls(workdir, manifest)
+            except (OSError, ValueError):
+                pass
+            console.print("⚠️  Source or settings changed - discarding previous segments")
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        os.makedirs(workdir, exist_ok=True)
+        keyframes = find_keyframes(video_path, fps) if align_keyframes else None
+        manifest = {
+            'source': fingerprint,
+            'settings': job_settings,
+            'fps': fps,
+            'segments': plan_segments(total_frames, segment_frames, keyframes),
+            'done': [],
+            'resume_frame': 0,
+        }
+        job = cls(workdir, manifest)
+        job.save()
+        return job
+
+    @property
+    def segments(self):
+        return self.manifest['segments']
+
+    def segment_file(self, segment):
+        return os.path.join(self.workdir, f"segment_{segment['index']:05d}.avi")
+
+    def segment_paths(self):
+        return [self.segment_file(segment) for segment in self.segments]
+
+    def is_done(self, segment):
+        return segment['index'] in self.manifest['done'] and os.path.exists(self.segment_file(segment))
+
+    def pending(self):
+        return [segment for segment in self.segments if not self.is_done(segment)]
+
+    def mark_done(self, segment):
+        if segment['index'] not in self.manifest['done']:
+            self.manifest['done'].append(segment['index'])
+        pending = self.pending()
+        self.manifest['resume_frame'] = pending[0]['start'] if pending else self.segments[-1]['end']
+        self.save()
+
+    def save(self):
+        # Write-then-rename so a crash never leaves a truncated manifest
+        fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=self.workdir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.workdir, self.MANIFEST))
+
+    def cleanup(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+def _convert_segment(video_path, settings, fps, segment, workdir):
+    """Worker process: decode, render, rasterize and encode one segment"""
+    converter = UltimateVideoConverter()
+    cap = cv2.VideoCapture(video_path)
+    cap.set(cv2.CAP_PROP_POS_FRAMES, segment['start'])
+    try:
+        return write_segment(cap, converter, settings, fps, segment, workdir)
+    finally:
+        cap.release()
+
+def write_segment(cap, converter, settings, fps, segment, workdir, on_frame=None):
+    """Read one segment's frames from cap and encode them into the job directory"""
+    # Encode into a temp file and rename when complete, so partial segments never count
+    fd, tmp_path = tempfile.mkstemp(suffix=".avi", dir=workdir)
+    os.close(fd)
+    out = cv2.VideoWriter(tmp_path, cv2.VideoWriter_fourcc(*'MJPG'), fps,
+                          (settings['width'], settings['height']))
+    frames = 0
+    try:
+        if not out.isOpened():
+            raise RuntimeError(f"Cannot create segment file {tmp_path}")
+        for _ in range(segment['end'] - segment['start']):
+            ret, frame = cap.read()
+            if not ret:
+                break
+            out.write(converter.render_output_frame(frame, settings))
+            frames += 1
+            if on_frame:
+                on_frame()
+    finally:
+        out.release()
+
+    os.replace(tmp_path, os.path.join(workdir, f"segment_{segment['index']:05d}.avi"))
+    return dict(segment, frames=frames)
+
+def concat_segments(segment_paths, output, fps, size, audio_source=None):
+    """Join segment files into output.
+
+    Uses ffmpeg's concat demuxer with stream copy when ffmpeg is installed, so
+    the MJPEG frames are not re-encoded; audio from audio_source is copied in
+    the same pass. Without ffmpeg the frames are decoded and re-encoded with
+    OpenCV and the output has no audio.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        audio_args = []
+        if audio_source and source_has_audio(audio_source):
+            console.print("🔊 Copying source audio into the output")
+            audio_args = ["-i", audio_source, "-map", "0:v", "-map", "1:a"]
+        fd, list_path = tempfile.mkstemp(suffix=".txt", dir=os.path.dirname(segment_paths[0]))
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for path in segment_paths:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        try:
+            result = subprocess.run(
+                [ffmpeg, "-y", "-v", "error", "-f", "concat", "-safe", "0",
+                 "-i", list_path, *audio_args, "-c", "copy", output],
+                capture_output=True, text=True,
+            )
+        finally:
+            os.remove(list_path)
+        if result.returncode != 0:
+            console.print(f"⚠️  ffmpeg concat failed: {result.stderr.strip()}")
+            return False
+        return True
+
+    console.print("⚠️  ffmpeg not found - joining segments with OpenCV (frames are re-encoded)")
+    if audio_source:
+        console.print("⚠️  Writing video only (source audio is not copied)")
+    out = cv2.VideoWriter(output, cv2.VideoWriter_fourcc(*'MJPG'), fps, size)
+    if not out.isOpened():
+        return False
+    try:
+        for path in segment_paths:
+            cap = cv2.VideoCapture(path)
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                out.write(frame)
+            cap.release()
+    finally:
+        out.release()
+    return True
+
+# ============================================================================
+# EXPORTERS - HTML, TEXT, ANSI, GIF, APNG
+# ============================================================================
+
+EXPORT_FORMATS = {
+    ".html": "html",
+    ".htm": "html",
+    ".txt": "text",
+    ".ans": "ansi",
+    ".gif": "gif",
+    ".png": "apng",
+    ".apng": "apng",
+}
+# Pixel size of one character cell in image exports
+EXPORT_CELL = (8, 16)
+# Palette index left transparent in delta frames
+TRANSPARENT_INDEX = 255
+
+def _color_runs(glyph_row, color_row, chars):
+    """Split one row into (text, (r, g, b)) runs of equal colour.
+
+    Spaces take the colour of the run they sit in, so they never start a run.
+    """
+    width = len(glyph_row)
+    is_space = np.array([chars[g] == ' ' for g in glyph_row.tolist()])
+    # Forward-fill colours over spaces
+    source = np.where(is_space, 0, np.arange(width))
+    source = np.maximum.accumulate(source)
+    filled = color_row[source]
+    starts = np.flatnonzero(np.r_[True, np.any(filled[1:] != filled[:-1], axis=1)])
+    ends = np.r_[starts[1:], width]
+    row_chars = [chars[g] for g in glyph_row.tolist()]
+    return [("".join(row_chars[start:end]), tuple(filled[start].tolist())) for start, end in zip(starts, ends)]
+
+@functools.lru_cache(maxsize=None)
+def export_palette():
+    """Global 256-entry palette: the 6x6x6 colour cube, padding, and a transparent slot"""
+    levels = np.array([0, 51, 102, 153, 204, 255], dtype=np.uint8)
+    cube = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(-1, 3)
+    palette = np.zeros((256, 3), dtype=np.uint8)
+    palette[:len(cube)] = cube
+    return palette
+
+def palette_indices(colors):
+    """Map an (..., 3) RGB array onto the colour cube of export_palette()"""
+    steps = (colors.astype(np.uint16) * 5 + 127) // 255
+    return (steps[..., 0] * 36 + steps[..., 1] * 6 + steps[..., 2]).astype(np.uint8)
+
+@functools.lru_cache(maxsize=None)
+def glyph_masks(charset, cell_width, cell_height):
+    """Binary ink masks per glyph; shade coverage is ordered-dithered"""
+    bayer = np.array([[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]], dtype=np.float32)
+    thresholds = (np.tile(bayer, (cell_height // 4 + 1, cell_width // 4 + 1))[:cell_height, :cell_width] + 0.5) / 16
+    return glyph_atlas(charset, cell_width, cell_height) > thresholds
+
+class TextExporter:
+    """Frame dump as plain text, or ANSI text that replays with `cat`"""
+    def __init__(self, path, charset, fps, ansi=False):
+        self.chars = ASCII_CHAR_SETS.get(charset, ASCII_CHAR_SETS["detailed"])
+        self.ansi = ansi
+        self.file = open(path, "w", encoding="utf-8")
+        self.frames = 0
+
+    def write_frame(self, glyphs, colors):
+        lines = []
+        if self.ansi:
+            lines.append(CLEAR_SCREEN if self.frames == 0 else "\033[H")
+            for glyph_row, color_row in zip(glyphs, colors):
+                runs = _color_runs(glyph_row, color_row, self.chars)
+                lines.append("".join(f"\033[38;2;{r};{g};{b}m{text}" for text, (r, g, b) in runs) + "\033[0m\n")
+        else:
+            if self.frames:
+                lines.append("\f\n")
+            lines.extend("".join(self.chars[g] for g in row) + "\n" for row in glyphs.tolist())
+        self.file.write("".join(lines))
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+
+class HtmlExporter:
+    """Self-contained HTML page; each frame is a <pre> with one <span> per colour run"""
+    def __init__(self, path, charset, fps):
+        self.chars = ASCII_CHAR_SETS.get(charset, ASCII_CHAR_SETS["detailed"])
+        self.fps = fps
+        self.file = open(path, "w", encoding="utf-8")
+        self.frames = 0
+        self.file.write(
+            "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>ASCII video</title>\n"
+            "<style>body{background:#000;margin:0}"
+            "pre{font:12px/1 monospace;color:#fff;margin:0;display:none}"
+            "pre.on{display:block}</style></head><body>\n"
+        )
+
+    def write_frame(self, glyphs, colors):
+        rows = []
+        for glyph_row, color_row in zip(glyphs, colors):
+            runs = _color_runs(glyph_row, color_row, self.chars)
+            rows.append("".join(
+                f'<span style="color:#{r:02x}{g:02x}{b:02x}">{html.escape(text)}</span>'
+                for text, (r, g, b) in runs
+            ))
+        css_class = ' class="on"' if self.frames == 0 else ""
+        self.file.write(f"<pre{css_class}>" + "\n".join(rows) + "</pre>\n")
+        self.frames += 1
+
+    def close(self):
+        self.file.write(
+            "<script>(function(){var f=document.getElementsByTagName('pre'),i=0;"
+            f"if(f.length>1)setInterval(function(){{f[i].className='';i=(i+1)%f.length;f[i].className='on';}},{1000 / self.fps:.3f});"
+            "})();</script>\n</body></html>\n"
+        )
+        self.file.close()
+
+class _ImageExporter:
+    """Shared rasterizing and frame-delta logic for palette-based animations"""
+    def __init__(self, path, charset, fps, cell=EXPORT_CELL):
+        self.path = path
+        self.charset = charset
+        self.fps = fps
+        self.cell_width, self.cell_height = cell
+        self.masks = glyph_masks(charset, self.cell_width, self.cell_height)
+        self.previous = None
+        self.frames = 0
+        self.file = None
+
+    def rasterize(self, glyphs, colors):
+        """Palette-index image for a frame: glyph masks filled with each cell's colour"""
+        rows, columns = glyphs.shape
+        cells = np.where(self.masks[glyphs], palette_indices(colors)[:, :, None, None], 0)
+        return cells.transpose(0, 2, 1, 3).reshape(rows * self.cell_height, columns * self.cell_width).astype(np.uint8)
+
+    def delta(self, pixels):
+        """(x, y, region) covering what changed; unchanged pixels inside are transparent"""
+        if self.previous is None:
+            return 0, 0, pixels
+        changed = pixels != self.previous
+        if not changed.any():
+            return 0, 0, np.full((1, 1), TRANSPARENT_INDEX, dtype=np.uint8)
+        ys = np.flatnonzero(changed.any(axis=1))
+        xs = np.flatnonzero(changed.any(axis=0))
+        y0, y1, x0, x1 = ys[0], ys[-1] + 1, xs[0], xs[-1] + 1
+        region = np.where(changed[y0:y1, x0:x1], pixels[y0:y1, x0:x1], TRANSPARENT_INDEX).astype(np.uint8)
+        return int(x0), int(y0), region
+
+    def frame_delay_cs(self):
+        """Frame delay in centiseconds, carrying rounding so the total stays in sync"""
+        return round((self.frames + 1) * 100 / self.fps) - round(self.frames * 100 / self.fps)
+
+    def write_frame(self, glyphs, colors):
+        pixels = self.rasterize(glyphs, colors)
+        if self.file is None:
+            self.file = open(self.path, "wb")
+            self.write_header(pixels.shape[1], pixels.shape[0])
+        x, y, region = self.delta(pixels)
+        self.write_image(x, y, region, self.frame_delay_cs())
+        self.previous = pixels
+        self.frames += 1
+
+class GifExporter(_ImageExporter):
+    """Animated GIF written frame by frame with one global palette"""
+    def __init__(self, path, charset, fps, cell=EXPORT_CELL):
+        if not pillow_available():
+            raise RuntimeError("GIF export needs Pillow: pip install pillow")
+        super().__init__(path, charset, fps, cell)
+
+    def write_header(self, width, height):
+        self.file.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF7, 0, 0))
+        self.file.write(export_palette().tobytes())
+        # Loop forever
+        self.file.write(b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def write_image(self, x, y, region, delay_cs):
+        from PIL import Image, GifImagePlugin
+
+        image = Image.fromarray(region, mode="P")
+        params = {"duration": delay_cs * 10, "disposal": 1}
+        if self.previous is not None:
+            params["transparency"] = TRANSPARENT_INDEX
+        for chunk in GifImagePlugin.getdata(image, offset=(x, y), **params):
+            self.file.write(chunk)
+
+    def close(self):
+        if self.file:
+            self.file.write(b";")
+            self.file.close()
+
+class ApngExporter(_ImageExporter):
+    """Animated PNG written frame by frame; the frame count is patched in on close"""
+    def _chunk(self, kind, data):
+        self.file.write(struct.pack(">I", len(data)) + kind + data)
+        self.file.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    def write_header(self, width, height):
+        self.sequence = 0
+        self.file.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0))
+        self.actl_offset = self.file.tell()
+        self._chunk(b"acTL", struct.pack(">II", 0, 0))
+        self._chunk(b"PLTE", export_palette().tobytes())
+        alpha = np.full(256, 255, dtype=np.uint8)
+        alpha[TRANSPARENT_INDEX] = 0
+        self._chunk(b"tRNS", alpha.tobytes())
+
+    def write_image(self, x, y, region, delay_cs):
+        height, width = region.shape
+        # dispose_op NONE, blend_op OVER keeps unchanged pixels from the previous frame
+        self._chunk(b"fcTL", struct.pack(">IIIIIHHBB", self.sequence, width, height, x, y,
+                                         delay_cs, 100, 0, 1 if self.previous is not None else 0))
+        self.sequence += 1
+        scanlines = np.hstack([np.zeros((height, 1), dtype=np.uint8), region])
+        data = zlib.compress(scanlines.tobytes(), 6)
+        if self.previous is None:
+            self._chunk(b"IDAT", data)
+        else:
+            self._chunk(b"fdAT", struct.pack(">I", self.sequence) + data)
+            self.sequence += 1
+
+    def close(self):
+        if not self.file:
+            return
+        self._chunk(b"IEND", b"")
+        self.file.seek(self.actl_offset)
+        self._chunk(b"acTL", struct.pack(">II", self.frames, 0))
+        self.file.close()
+
+def create_exporter(path, charset, fps, fmt=None):
+    """Exporter for an explicit format or the output file's extension"""
+    fmt = fmt or EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt == "html":
+        return HtmlExporter(path, charset, fps)
+    if fmt in ("text", "ansi"):
+        return TextExporter(path, charset, fps, ansi=(fmt == "ansi"))
+    if fmt == "gif":
+        return GifExporter(path, charset, fps)
+    if fmt == "apng":
+        return ApngExporter(path, charset, fps)
+    raise ValueError(f"Unknown export format for {path!r}; use one of: html, text, ansi, gif, apng")
+
+# ============================================================================
+# PREVIEW - KEYFRAME CONTACT SHEETS
+# ============================================================================
+
+PREVIEW_COUNT = 12
+PREVIEW_COLUMNS = 4
+
+def preview_times(duration, count):
+    """Evenly spaced sample times, each in the middle of its slice of the clip"""
+    return [(index + 0.5) * duration / count for index in range(count)]
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_passthrough_args(ffmpeg):
+    """Frame-rate passthrough flag: -fps_mode on ffmpeg 5.1+, -vsync before that"""
+    result = subprocess.run([ffmpeg, "-hide_banner", "-h", "long"], capture_output=True, text=True)
+    return ["-fps_mode" if "-fps_mode" in result.stdout else "-vsync", "passthrough"]
+
+def _ffmpeg_keyframe(ffmpeg, video_path, timestamp, size):
+    """Keyframe at or before timestamp; only that frame is decoded.
+
+    Returns (frame, keyframe_time) or (None, None). showinfo reports the pts
+    relative to the seek point, so the keyframe's time is timestamp + pts_time.
+    """
+    result = subprocess.run(
+        [ffmpeg, "-hide_banner", "-loglevel", "info",
+         "-skip_frame", "nokey", "-noaccurate_seek", "-ss", f"{timestamp:.3f}",
+         "-i", video_path, "-frames:v", "1", "-vf", "showinfo",
+         # Keep the keyframe even though its timestamp is before the seek point
+         *_ffmpeg_passthrough_args(ffmpeg),
+         "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"],
+        capture_output=True,
+    )
+    width, height = size
+    if result.returncode != 0 or len(result.stdout) != width * height * 3:
+        return None, None
+    frame = np.frombuffer(result.stdout, dtype=np.uint8).reshape(height, width, 3)
+
+    stderr = result.stderr.decode('utf-8', 'replace')
+    marker = stderr.find("pts_time:")
+    try:
+        offset = float(stderr[marker + len("pts_time:"):].split()[0]) if marker >= 0 else 0.0
+    except (ValueError, IndexError):
+        offset = 0.0
+    return frame, max(0.0, round(timestamp + offset, 3))
+
+def read_preview_frames(video_path, count):
+    """Decode `count` evenly spaced frames. Returns (times, frames, method).
+
+    With ffmpeg every sample is one seek plus one keyframe decode, run in
+    parallel; the keyframe can be up to a GOP before the requested point, so
+    times holds where each decoded frame actually sits in the clip. Without
+    ffmpeg (or for samples it could not read) OpenCV seeks to the exact frame
+    index, decoding from the previous keyframe onwards. method names the
+    path each decoded frame actually took, with counts when they are mixed.
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        return None, None, None
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+    size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+    if total_frames <= 0:
+        cap.release()
+        return None, None, None
+
+    times = preview_times(total_frames / fps, count)
+    frames = [None] * len(times)
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        with ThreadPoolExecutor(max_workers=min(len(times), os.cpu_count() or 1)) as pool:
+            samples = list(pool.map(lambda t: _ffmpeg_keyframe(ffmpeg, video_path, t, size), times))
+        frames = [frame for frame, _ in samples]
+        times = [actual if actual is not None else requested
+                 for (_, actual), requested in zip(samples, times)]
+    keyframes = sum(frame is not None for frame in frames)
+
+    for index, timestamp in enumerate(times):
+        if frames[index] is None:
+            frame_index = min(total_frames - 1, int(timestamp * fps))
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+            ret, frame = cap.read()
+            frames[index] = frame if ret else None
+            times[index] = frame_index / fps
+    cap.release()
+
+    seeks = sum(frame is not None for frame in frames) - keyframes
+    if keyframes and seeks:
+        method = f"ffmpeg keyframes ({keyframes}) and OpenCV seeks ({seeks})"
+    else:
+        method = "ffmpeg keyframes" if keyframes else "OpenCV seeks"
+    return times, frames, method
+
+def _format_timestamp(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+class ContactSheet:
+    """Rendered thumbnails in a grid, each labelled with its time in the clip"""
+    def __init__(self, settings, columns=PREVIEW_COLUMNS):
+        self.settings = settings
+        self.columns = columns
+        self.chars = ASCII_CHAR_SETS.get(settings['charset'], ASCII_CHAR_SETS["detailed"])
+        self.renderer = AdvancedAsciiRenderer()
+        self.thumbnails = []
+
+    def add(self, frame, timestamp):
+        glyphs, colors = self.renderer.render_arrays(frame, self.settings['width'], self.settings['charset'],
+                                                     self.settings['colorize'],
+                                                     self.settings.get('shape_aware', False))
+        if glyphs is not None:
+            self.thumbnails.append((glyphs, colors, _format_timestamp(timestamp)))
+
+    def _grid_rows(self):
+        for start in range(0, len(self.thumbnails), self.columns):
+            yield self.thumbnails[start:start + self.columns]
+
+    def to_ansi(self):
+        """The sheet as colour text ready to print"""
+        width = self.settings['width']
+        lines = []
+        for row in self._grid_rows():
+            for y in range(max(glyphs.shape[0] for glyphs, _, _ in row)):
+                parts = []
+                for glyphs, colors, _ in row:
+                    if y >= glyphs.shape[0]:
+                        parts.append(" " * width)
+                        continue
+                    runs = _color_runs(glyphs[y], colors[y], self.chars)
+                    parts.append("".join(f"\033[38;2;{r};{g};{b}m{text}" for text, (r, g, b) in runs) + "\033[0m")
+                lines.append(" ".join(parts))
+            lines.append(" ".join(label.ljust(width) for _, _, label in row).rstrip())
+            lines.append("")
+        return "\n".join(lines)
+
+    def save(self, path, cell=EXPORT_CELL):
+        """Rasterize the sheet with the export glyph masks and write it with OpenCV"""
+        cell_width, cell_height = cell
+        masks = glyph_masks(self.settings['charset'], cell_width, cell_height)
+        width = self.settings['width']
+        tile_rows = max(glyphs.shape[0] for glyphs, _, _ in self.thumbnails)
+        # One blank cell between tiles, one label row under each
+        pitch_x, pitch_y = (width + 1) * cell_width, (tile_rows + 2) * cell_height
+        grid_rows = -(-len(self.thumbnails) // self.columns)
+        sheet = np.zeros((grid_rows * pitch_y, min(self.columns, len(self.thumbnails)) * pitch_x, 3), dtype=np.uint8)
+
+        for index, (glyphs, colors, label) in enumerate(self.thumbnails):
+            row, column = divmod(index, self.columns)
+            rows = glyphs.shape[0]
+            pixels = np.where(masks[glyphs][..., None], colors[:, :, None, None, :], 0)
+            pixels = pixels.transpose(0, 2, 1, 3, 4).reshape(rows * cell_height, width * cell_width, 3)
+            y, x = row * pitch_y, column * pitch_x
+            sheet[y:y + pixels.shape[0], x:x + pixels.shape[1]] = pixels
+            cv2.putText(sheet, label, (x, y + (tile_rows + 1) * cell_height - cell_height // 4),
+                        cv2.FONT_HERSHEY_SIMPLEX, cell_height / 32, (255, 255, 255), 1, cv2.LINE_AA)
+        return cv2.imwrite(path, cv2.cvtColor(sheet, cv2.COLOR_RGB2BGR))
+
+def time_full_render(video_path, settings):
+    """Decode and render every frame, as pre_render_video would. Returns (frames, seconds)"""
+    renderer = AdvancedAsciiRenderer()
+    cap = cv2.VideoCapture(video_path)
+    start = time.perf_counter()
+    frames = 0
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        renderer.render_arrays(frame, settings['width'], settings['charset'], settings['colorize'],
+                               settings.get('shape_aware', False))
+        frames += 1
+    cap.release()
+    return frames, time.perf_counter() - start
+
 # ============================================================================
 # MAIN APPLICATION - 1000+ LINES COMPLETE
 # ============================================================================
@@ -901,13 +2798,22 @@ class UltimateAsciiSuite:
         
     def show_system_info(self):
         console.print("\n⚙️  System Information:")
-        console.print(f"🎨 Rich UI: {'✅ Available' if RICH_AVAILABLE else '❌ Not available'}")
-        console.print(f"🖼️  Pillow: {'✅ Available' if PILLOW_AVAILABLE else '❌ Not available'}")
-        console.print(f"⌨️  Keyboard: {'✅ Available' if KEYBOARD_AVAILABLE else '❌ Not available'}")
-        console.print(f"🔊 Audio: {'✅ Available' if AUDIO_AVAILABLE else '❌ Not available'}")
+        capabilities = {
+            "rich": rich_available(),
+            "pillow": pillow_available(),
+            "keyboard": keyboard_available(),
+            "audio": audio_available(),
+        }
+        console.print(f"🎨 Rich UI: {'✅ Available' if capabilities['rich'] else '❌ Not available'}")
+        console.print(f"🖼️  Pillow: {'✅ Available' if capabilities['pillow'] else '❌ Not available'}")
+        console.print(f"⌨️  Keyboard: {'✅ Available' if capabilities['keyboard'] else '❌ Not available'}")
+        console.print(f"🔊 Audio: {'✅ Available' if capabilities['audio'] else '❌ Not available'}")
         console.print(f"🐍 Python: {sys.version.split()[0]}")
         
         console.print("\n💡 Installation tips:")
+        for feature, available in capabilities.items():
+            if not available:
+                console.print(INSTALL_HINTS[feature])
         console.print("pip install opencv-python rich pillow pynput ffpyplayer")
         
     def run(self):
@@ -936,39 +2842,294 @@ class UltimateAsciiSuite:
                 console.input("\nPress Enter to continue...")
                 console.clear()
 
-# Import numpy for converter
-try:
-    import numpy as np
-except ImportError:
-    # Basic numpy replacement
-    class SimpleNP:
-        @staticmethod
-        def array(data, dtype=None):
-            return data
-        @staticmethod  
-        def zeros(shape, dtype=None):
-            if len(shape) == 2:
-                return [[0] * shape[1] for _ in range(shape[0])]
-            elif len(shape) == 3:
-                return [[[0] * shape[2] for _ in range(shape[1])] for _ in range(shape[0])]
-            return [[0] * shape[1] for _ in range(shape[0])]
-    np = SimpleNP()
+# ============================================================================
+# COMMAND LINE INTERFACE
+# ============================================================================
 
-def main():
-    try:
-        # Check for OpenCV (required)
+def _style_arguments():
+    """Parent parser for the rendering style flags shared by every rendering command"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--charset", default="detailed", choices=list(ASCII_CHAR_SETS.keys()))
+    parser.add_argument("--no-color", action="store_true", help="Grayscale output")
+    parser.add_argument("--shape", action="store_true", help="Match glyph shapes to sub-cell detail (high quality)")
+    return parser
+
+def _headless_arguments():
+    """Parent parser for commands that can write their escape stream instead of drawing it"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--headless", metavar="OUTPUT",
+                        help="Write the escape stream to a file, pipe or '-' instead of the terminal")
+    parser.add_argument("--cast", action="store_true",
+                        help="Write an asciinema .cast recording (implied by a .cast extension)")
+    return parser
+
+def wants_cast(args):
+    """True when a headless command should record asciinema .cast output"""
+    return bool(args.headless) and (args.cast or args.headless.endswith('.cast'))
+
+def build_arg_parser():
+    style = _style_arguments()
+    headless = _headless_arguments()
+    parser = argparse.ArgumentParser(
+        description="DILL ULTIMATE ASCII SUITE - run without arguments for the interactive menu"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    play = subparsers.add_parser("play", parents=[style, headless], help="Play a video in the terminal")
+    play.add_argument("video", help="Path to the video file")
+    play.add_argument("--width", type=int, help="ASCII width in characters (default: fit terminal)")
+    play.add_argument("--no-audio", action="store_true", help="Disable audio playback")
+    play.add_argument("--memory-budget", default=DEFAULT_MEMORY_BUDGET, type=parse_memory_size,
+                      help=f"Memory for compressed pre-rendered frames, e.g. 256M or 2G (default {DEFAULT_MEMORY_BUDGET})")
+    play.add_argument("--realtime", action="store_true",
+                      help="Headless mode paces frames in real time instead of maximum speed")
+
+    convert = subparsers.add_parser("convert", parents=[style], help="Convert a video to an ASCII video file")
+    convert.add_argument("video", help="Path to the video file")
+    convert.add_argument("-o", "--output", default="converted_ascii_video.avi")
+    convert.add_argument("--size", default="1280x720", help="Output resolution as WIDTHxHEIGHT")
+    convert.add_argument("--no-audio", action="store_true",
+                         help="Do not copy the source audio into the output (copying needs ffmpeg)")
+    convert.add_argument("--workers", type=int, default=1,
+                         help="Convert this many segments in parallel (resumable when > 1)")
+    convert.add_argument("--checkpoint-every", type=float, metavar="SECONDS",
+                         help=f"Checkpoint long conversions every SECONDS of source "
+                              f"(default {CHECKPOINT_SECONDS} when ffmpeg is installed, otherwise off; 0 disables)")
+
+    live = subparsers.add_parser("live", parents=[style, headless],
+                                 help="Play a capture device or network stream with minimal latency")
+    live.add_argument("source", help="Device index (0), device path (/dev/video0), stream URL "
+                                     "(udp://, rtsp://, ...) or '-' for stdin")
+    live.add_argument("--width", type=int, help="ASCII width in characters (default: fit terminal)")
+    live.add_argument("--duration", type=float, help="Stop after this many seconds")
+
+    export = subparsers.add_parser("export", parents=[style],
+                                   help="Export ASCII frames as HTML, text, ANSI, GIF or APNG")
+    export.add_argument("video", help="Path to the video file")
+    export.add_argument("-o", "--output", required=True,
+                        help="Output file; format from extension (.html .txt .ans .gif .png)")
+    export.add_argument("--format", choices=sorted(set(EXPORT_FORMATS.values())), help="Override the format")
+    export.add_argument("--width", type=int, default=100, help="ASCII width in characters (default 100)")
+
+    preview = subparsers.add_parser("preview", parents=[style], help="Contact sheet of evenly spaced keyframes")
+    preview.add_argument("video", help="Path to the video file")
+    preview.add_argument("-n", "--count", type=int, default=PREVIEW_COUNT,
+                         help=f"Number of thumbnails (default {PREVIEW_COUNT})")
+    preview.add_argument("--columns", type=int, default=PREVIEW_COLUMNS,
+                         help=f"Thumbnails per row (default {PREVIEW_COLUMNS})")
+    preview.add_argument("--width", type=int, help="Thumbnail width in characters (default: fit terminal)")
+    preview.add_argument("-o", "--output", help="Save the sheet as an image (.png, .jpg) instead of printing it")
+    preview.add_argument("--compare", action="store_true",
+                         help="Also time rendering every frame of the clip at the same settings")
+
+    wall = subparsers.add_parser("wall", parents=[style, headless], help="Play several videos tiled in a grid")
+    wall.add_argument("videos", nargs="+", help="Video files or stream URLs")
+    wall.add_argument("--columns", type=int, help="Tiles per row (default: square grid)")
+    wall.add_argument("--size", help="Wall size in characters as COLSxROWS (default: terminal size)")
+    wall.add_argument("--workers", type=int, help="Render threads shared by all tiles")
+    wall.add_argument("--loop", action="store_true", help="Restart each video when it ends")
+    wall.add_argument("--duration", type=float, help="Stop after this many seconds")
+    wall.add_argument("--max-speed", action="store_true",
+                      help="Headless mode refreshes back to back instead of in real time")
+
+    subparsers.add_parser("info", help="Show system information")
+    return parser
+
+def run_play_command(args):
+    player = UltimateVideoPlayer()
+    settings = {
+        'charset': args.charset,
+        'auto_width': args.width is None,
+        'width': args.width,
+        'colorize': not args.no_color,
+        'shape_aware': args.shape,
+        'audio': not args.headless and not args.no_audio and audio_available(),
+        'memory_budget': args.memory_budget,
+    }
+
+    if not args.headless:
+        success, frame_cache, width, height, fps = player.pre_render_video(args.video, settings)
+        if success:
+            player.play_video(args.video, frame_cache, width, height, fps, settings)
+        return 0 if success else 1
+
+    # Keep status messages off stdout when the escape stream goes there
+    status_target = sys.stderr if args.headless == '-' else sys.stdout
+    with contextlib.redirect_stdout(status_target):
+        success, frame_cache, width, height, fps = player.pre_render_video(args.video, settings)
+    if not success:
+        return 1
+
+    cast = wants_cast(args)
+    stats = player.play_headless(frame_cache, width, height, fps, settings['charset'], args.headless,
+                                 cast=cast, realtime=args.realtime)
+    with contextlib.redirect_stdout(status_target):
+        player.show_headless_report(stats, args.headless)
+    return 0
+
+def run_live_command(args):
+    player = UltimateVideoPlayer()
+    settings = {
+        'charset': args.charset,
+        'auto_width': args.width is None,
+        'width': args.width,
+        'colorize': not args.no_color,
+        'shape_aware': args.shape,
+    }
+    cast = wants_cast(args)
+    status_target = sys.stderr if args.headless == '-' else sys.stdout
+    stats = player.play_live(args.source, settings, output=args.headless, cast=cast, duration=args.duration)
+    if stats is None:
+        return 1
+    with contextlib.redirect_stdout(status_target):
+        player.show_live_report(stats)
+    return 0
+
+def run_export_command(args):
+    settings = {
+        'columns': args.width,
+        'charset': args.charset,
+        'colorize': not args.no_color,
+        'shape_aware': args.shape,
+        'output': args.output,
+    }
+    converter = UltimateVideoConverter()
+    return 0 if converter.export_video(args.video, settings, args.format) else 1
+
+def run_preview_command(args):
+    if not os.path.exists(args.video):
+        console.print(f"❌ File not found: {args.video}")
+        return 1
+    columns = max(1, min(args.columns, args.count))
+    width = args.width or max(8, (shutil.get_terminal_size().columns - (columns - 1)) // columns)
+    settings = {
+        'width': width,
+        'charset': args.charset,
+        'colorize': not args.no_color,
+        'shape_aware': args.shape,
+    }
+
+    start = time.perf_counter()
+    times, frames, method = read_preview_frames(args.video, max(1, args.count))
+    if times is None:
+        console.print("❌ Failed to open video file")
+        return 1
+    decoded = time.perf_counter()
+    sheet = ContactSheet(settings, columns)
+    for frame, timestamp in zip(frames, times):
+        if frame is not None:
+            sheet.add(frame, timestamp)
+    elapsed = time.perf_counter() - start
+    if not sheet.thumbnails:
+        console.print("❌ No frames could be decoded")
+        return 1
+
+    if args.output:
+        if not sheet.save(args.output):
+            console.print(f"❌ Cannot write {args.output}")
+            return 1
+        console.print(f"💾 Contact sheet saved to: {args.output}")
+    else:
+        print(sheet.to_ansi())
+    console.print(f"⚡ {len(sheet.thumbnails)} frames via {method} in {elapsed:.2f}s "
+                  f"(decode {decoded - start:.2f}s, render {elapsed - (decoded - start):.2f}s)")
+
+    if args.compare:
+        console.print("🐢 Rendering every frame for comparison...")
+        total, full_seconds = time_full_render(args.video, settings)
+        console.print(f"📊 Full render: {total} frames in {full_seconds:.2f}s - "
+                      f"preview was {full_seconds / elapsed:.0f}x faster")
+    return 0
+
+def run_wall_command(args):
+    size = None
+    if args.size:
         try:
-            import cv2
-        except ImportError:
-            console.print("❌ OpenCV is required. Install with: pip install opencv-python")
-            return
-            
+            size = tuple(int(v) for v in args.size.lower().split('x'))
+        except ValueError:
+            console.print(f"❌ Invalid size '{args.size}', expected COLSxROWS")
+            return 1
+    settings = {
+        'charset': args.charset,
+        'colorize': not args.no_color,
+        'shape_aware': args.shape,
+    }
+    missing = [video for video in args.videos if "://" not in video and not os.path.exists(video)]
+    if missing:
+        console.print(f"❌ File not found: {', '.join(missing)}")
+        return 1
+
+    wall = VideoWall(args.videos, settings, columns=args.columns, size=size, workers=args.workers)
+    if wall.failed_sources:
+        for tile in wall.tiles:
+            tile.release()
+        console.print(f"❌ Cannot open: {', '.join(wall.failed_sources)}")
+        return 1
+    cast = wants_cast(args)
+    stats = wall.run(output=args.headless, cast=cast, realtime=not (args.headless and args.max_speed),
+                     duration=args.duration, loop=args.loop)
+    with contextlib.redirect_stdout(sys.stderr if args.headless == '-' else sys.stdout):
+        wall.show_report(stats)
+    return 0
+
+def run_convert_command(args):
+    try:
+        width, height = (int(v) for v in args.size.lower().split('x'))
+    except ValueError:
+        console.print(f"❌ Invalid size '{args.size}', expected WIDTHxHEIGHT")
+        return 1
+
+    settings = {
+        'width': width,
+        'height': height,
+        'charset': args.charset,
+        'colorize': not args.no_color,
+        'shape_aware': args.shape,
+        'audio': not args.no_audio,
+        'output': args.output,
+        'workers': max(1, args.workers),
+        'checkpoint_every': args.checkpoint_every,
+    }
+    converter = UltimateVideoConverter()
+    return 0 if converter.convert_video(args.video, settings) else 1
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    # Every mode except info needs OpenCV; checked here so --help stays fast
+    if args.command != "info" and _optional_import("cv2") is None:
+        console.print(INSTALL_HINTS["opencv"])
+        return 1
+    try:
+        if args.command == "play":
+            return run_play_command(args)
+        if args.command == "convert":
+            return run_convert_command(args)
+        if args.command == "live":
+            return run_live_command(args)
+        if args.command == "export":
+            return run_export_command(args)
+        if args.command == "wall":
+            return run_wall_command(args)
+        if args.command == "preview":
+            return run_preview_command(args)
+        if args.command == "info":
+            UltimateAsciiSuite().show_system_info()
+            return 0
+
         suite = UltimateAsciiSuite()
         suite.run()
     except KeyboardInterrupt:
         console.print("\n👋 Goodbye!")
+    except BrokenPipeError:
+        # Reader of a headless stream went away; silence the final flush
+        sys.stdout = open(os.devnull, 'w')
+        return 1
+    except ImportError as e:
+        console.print(f"\n❌ Missing dependency: {e}")
+        return 1
     except Exception as e:
         console.print(f"\n❌ Unexpected error: {e}")
+        return 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file